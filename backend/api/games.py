@@ -1,10 +1,11 @@
 """ゲームAPI"""
 
 import logging
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, request
 from flask_socketio import emit
 
 from backend.games.state import GameStateManager
+from backend.utils import ojsonify
 
 logger = logging.getLogger(__name__)
 
@@ -38,13 +39,13 @@ def create_game():
 
         # バリデーション
         if not player_names:
-            return jsonify({
+            return ojsonify({
                 'success': False,
                 'error': 'プレイヤー名が指定されていません'
             }), 400
 
         if len(player_names) < 1:
-            return jsonify({
+            return ojsonify({
                 'success': False,
                 'error': 'プレイヤーは1人以上必要です'
             }), 400
@@ -53,20 +54,20 @@ def create_game():
         game_id = game_manager.create_game(game_type, player_names, settings)
         game = game_manager.get_game(game_id)
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'game_id': game_id,
             'game_state': game.get_state()
         })
 
     except ValueError as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 400
     except Exception as e:
         logger.error(f"ゲーム作成エラー: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -79,19 +80,57 @@ def get_game_state(game_id):
         game = game_manager.get_game(game_id)
 
         if not game:
-            return jsonify({
+            return ojsonify({
                 'success': False,
                 'error': 'ゲームが見つかりません'
             }), 404
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'game_state': game.get_state()
         })
 
     except Exception as e:
         logger.error(f"ゲーム状態取得エラー: {e}")
-        return jsonify({
+        return ojsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@games_bp.route('/<game_id>/history', methods=['GET'])
+def get_game_history(game_id):
+    """
+    ゲーム履歴を取得（get_stateは直近ラウンドのみ返すため、全履歴はこちら）
+
+    Query Parameters:
+        offset (int): 取得開始位置（デフォルト: 0）
+        limit (int): 取得件数の上限
+    """
+    try:
+        game = game_manager.get_game(game_id)
+
+        if not game:
+            return ojsonify({
+                'success': False,
+                'error': 'ゲームが見つかりません'
+            }), 404
+
+        history = game.get_full_history()
+        offset = request.args.get('offset', 0, type=int)
+        limit = request.args.get('limit', type=int)
+
+        page = history[offset:offset + limit] if limit else history[offset:]
+
+        return ojsonify({
+            'success': True,
+            'history': page,
+            'count': len(history)
+        })
+
+    except Exception as e:
+        logger.error(f"ゲーム履歴取得エラー: {e}")
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -104,19 +143,19 @@ def delete_game(game_id):
         success = game_manager.delete_game(game_id)
 
         if not success:
-            return jsonify({
+            return ojsonify({
                 'success': False,
                 'error': 'ゲームが見つかりません'
             }), 404
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'message': 'ゲームを削除しました'
         })
 
     except Exception as e:
         logger.error(f"ゲーム削除エラー: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -128,7 +167,7 @@ def list_games():
     try:
         games = game_manager.list_games()
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'games': games,
             'count': len(games)
@@ -136,7 +175,7 @@ def list_games():
 
     except Exception as e:
         logger.error(f"ゲーム一覧取得エラー: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -156,19 +195,19 @@ def process_throw(game_id):
         result = game_manager.handle_throw_for_game(game_id, throw_data)
 
         if result is None:
-            return jsonify({
+            return ojsonify({
                 'success': False,
                 'error': 'ゲームが見つかりません'
             }), 404
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'result': result
         })
 
     except Exception as e:
         logger.error(f"投擲処理エラー: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
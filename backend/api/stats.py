@@ -1,24 +1,24 @@
 """統計API"""
 
 import logging
-from flask import Blueprint, jsonify, request
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from flask import Blueprint, request
 
-from src.data.storage import DartDatabase
-from src.data.analyzer import DartAnalyzer
-from src.core.config import AppConfig
+from backend.cache import cached
+from backend.utils import ojsonify, parse_iso
+from backend.deps import analyzer
 
 logger = logging.getLogger(__name__)
 
 stats_bp = Blueprint('stats', __name__, url_prefix='/api/stats')
 
-# データベースとアナライザー初期化
-config = AppConfig()
-db = DartDatabase(config.db_path)
-analyzer = DartAnalyzer(db)
+# ダッシュボード用の並列クエリプール
+# （SQLiteはクエリ実行中にGILを解放するため、読み取りは並列化できる）
+_pool = ThreadPoolExecutor(max_workers=4)
 
 
 @stats_bp.route('', methods=['GET'])
+@cached(ttl=5.0)
 def get_statistics():
     """
     基本統計情報を取得
@@ -33,8 +33,8 @@ def get_statistics():
         start_time_str = request.args.get('start_time')
         end_time_str = request.args.get('end_time')
 
-        start_time = datetime.fromisoformat(start_time_str) if start_time_str else None
-        end_time = datetime.fromisoformat(end_time_str) if end_time_str else None
+        start_time = parse_iso(start_time_str)
+        end_time = parse_iso(end_time_str)
 
         stats = analyzer.get_statistics(
             device_address=device_address,
@@ -42,20 +42,21 @@ def get_statistics():
             end_time=end_time
         )
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'statistics': stats
         })
 
     except Exception as e:
         logger.error(f"統計情報取得エラー: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
 @stats_bp.route('/segments', methods=['GET'])
+@cached(ttl=5.0)
 def get_segment_distribution():
     """
     セグメント分布を取得
@@ -72,8 +73,8 @@ def get_segment_distribution():
         start_time_str = request.args.get('start_time')
         end_time_str = request.args.get('end_time')
 
-        start_time = datetime.fromisoformat(start_time_str) if start_time_str else None
-        end_time = datetime.fromisoformat(end_time_str) if end_time_str else None
+        start_time = parse_iso(start_time_str)
+        end_time = parse_iso(end_time_str)
 
         distribution = analyzer.get_segment_distribution(
             device_address=device_address,
@@ -88,20 +89,21 @@ def get_segment_distribution():
             for segment, count in distribution
         ]
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'distribution': distribution_data
         })
 
     except Exception as e:
         logger.error(f"セグメント分布取得エラー: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
 @stats_bp.route('/scores', methods=['GET'])
+@cached(ttl=5.0)
 def get_score_distribution():
     """得点分布を取得"""
     try:
@@ -109,8 +111,8 @@ def get_score_distribution():
         start_time_str = request.args.get('start_time')
         end_time_str = request.args.get('end_time')
 
-        start_time = datetime.fromisoformat(start_time_str) if start_time_str else None
-        end_time = datetime.fromisoformat(end_time_str) if end_time_str else None
+        start_time = parse_iso(start_time_str)
+        end_time = parse_iso(end_time_str)
 
         distribution = analyzer.get_score_distribution(
             device_address=device_address,
@@ -124,47 +126,114 @@ def get_score_distribution():
             for score, count in distribution.items()
         ]
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'distribution': distribution_data
         })
 
     except Exception as e:
         logger.error(f"得点分布取得エラー: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
 @stats_bp.route('/daily', methods=['GET'])
+@cached(ttl=5.0)
 def get_daily_summary():
     """日別サマリーを取得"""
     try:
         date_str = request.args.get('date')
         device_address = request.args.get('device_address')
 
-        date = datetime.fromisoformat(date_str) if date_str else None
+        date = parse_iso(date_str)
 
         summary = analyzer.get_daily_summary(
             date=date,
             device_address=device_address
         )
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'summary': summary
         })
 
     except Exception as e:
         logger.error(f"日別サマリー取得エラー: {e}")
-        return jsonify({
+        return ojsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@stats_bp.route('/dashboard', methods=['GET'])
+@cached(ttl=5.0)
+def get_dashboard():
+    """
+    ダッシュボード用の統計をまとめて取得
+
+    各統計エンドポイントが個別に返す内容を1レスポンスに集約し、
+    基盤となるクエリはスレッドプールで並列実行する。
+
+    Query Parameters:
+        device_address (str): デバイスアドレスでフィルタ
+        start_time (str): 開始時刻でフィルタ (ISO形式)
+        end_time (str): 終了時刻でフィルタ (ISO形式)
+        limit (int): 直近投擲の取得件数（デフォルト: 10）
+    """
+    try:
+        device_address = request.args.get('device_address')
+        start_time = parse_iso(request.args.get('start_time'))
+        end_time = parse_iso(request.args.get('end_time'))
+        limit = request.args.get('limit', 10, type=int)
+
+        window = {
+            'device_address': device_address,
+            'start_time': start_time,
+            'end_time': end_time
+        }
+
+        futures = {
+            'statistics': _pool.submit(analyzer.get_statistics, **window),
+            'segments': _pool.submit(analyzer.get_segment_distribution, **window),
+            'scores': _pool.submit(analyzer.get_score_distribution, **window),
+            'daily': _pool.submit(
+                analyzer.get_daily_summary, device_address=device_address
+            ),
+            'recent': _pool.submit(
+                analyzer.get_recent_throws_summary,
+                limit=limit,
+                device_address=device_address
+            ),
+        }
+        results = {key: future.result() for key, future in futures.items()}
+
+        # 各エンドポイントと同じ形式に変換
+        results['segments'] = [
+            {'segment_name': segment, 'count': count}
+            for segment, count in results['segments']
+        ]
+        results['scores'] = [
+            {'score': score, 'count': count}
+            for score, count in results['scores'].items()
+        ]
+
+        return ojsonify({
+            'success': True,
+            **results
+        })
+
+    except Exception as e:
+        logger.error(f"ダッシュボード統計取得エラー: {e}")
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
 @stats_bp.route('/recent', methods=['GET'])
+@cached(ttl=5.0)
 def get_recent_throws():
     """直近の投擲サマリーを取得"""
     try:
@@ -176,14 +245,14 @@ def get_recent_throws():
             device_address=device_address
         )
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'throws': recent_throws
         })
 
     except Exception as e:
         logger.error(f"直近投擲取得エラー: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
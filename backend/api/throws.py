@@ -1,20 +1,17 @@
 """投擲データAPI"""
 
 import logging
-from flask import Blueprint, jsonify, request
-from datetime import datetime
+from flask import Blueprint, Response, request
 
-from src.data.storage import DartDatabase
-from src.core.config import AppConfig
+import orjson
+
+from backend.deps import db
+from backend.utils import ojsonify, parse_iso
 
 logger = logging.getLogger(__name__)
 
 throws_bp = Blueprint('throws', __name__, url_prefix='/api/throws')
 
-# データベース初期化
-config = AppConfig()
-db = DartDatabase(config.db_path)
-
 
 @throws_bp.route('', methods=['GET'])
 def get_throws():
@@ -35,8 +32,8 @@ def get_throws():
         end_time_str = request.args.get('end_time')
 
         # 日時パース
-        start_time = datetime.fromisoformat(start_time_str) if start_time_str else None
-        end_time = datetime.fromisoformat(end_time_str) if end_time_str else None
+        start_time = parse_iso(start_time_str)
+        end_time = parse_iso(end_time_str)
 
         # データベースから取得
         throws = db.get_throws(
@@ -46,18 +43,21 @@ def get_throws():
             end_time=end_time
         )
 
-        # 辞書形式に変換
-        throws_data = [throw.to_dict() for throw in throws]
+        # レスポンス全体を組み立てずに1件ずつシリアライズして配信
+        # （大きなlimitでもピークメモリは1行分に抑えられる）
+        def generate():
+            yield b'{"success":true,"count":' + str(len(throws)).encode() + b',"throws":['
+            for i, throw in enumerate(throws):
+                if i > 0:
+                    yield b','
+                yield orjson.dumps(throw.to_dict())
+            yield b']}'
 
-        return jsonify({
-            'success': True,
-            'count': len(throws_data),
-            'throws': throws_data
-        })
+        return Response(generate(), mimetype='application/json')
 
     except Exception as e:
         logger.error(f"投擲データ取得エラー: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -71,8 +71,8 @@ def get_throw_count():
         start_time_str = request.args.get('start_time')
         end_time_str = request.args.get('end_time')
 
-        start_time = datetime.fromisoformat(start_time_str) if start_time_str else None
-        end_time = datetime.fromisoformat(end_time_str) if end_time_str else None
+        start_time = parse_iso(start_time_str)
+        end_time = parse_iso(end_time_str)
 
         count = db.get_throw_count(
             device_address=device_address,
@@ -80,14 +80,14 @@ def get_throw_count():
             end_time=end_time
         )
 
-        return jsonify({
+        return ojsonify({
             'success': True,
             'count': count
         })
 
     except Exception as e:
         logger.error(f"投擲数取得エラー: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -1,19 +1,30 @@
 """Flaskアプリケーションのメインファイル"""
 
+import os
+
+# 環境変数SOCKETIO_ASYNC_MODE=eventletで協調スレッド（greenlet）モードに切り替え可能。
+# 多数のWebSocketクライアントを1スレッドで捌けるが、monkey_patchは
+# 他のimportより先に行う必要がある。デフォルトはBLE用asyncioスレッドとの
+# 干渉がないことが確認済みのthreadingモード。
+async_mode = os.environ.get('SOCKETIO_ASYNC_MODE', 'threading')
+if async_mode == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
 import logging
-from flask import Flask, jsonify, send_from_directory
+from flask import Flask, Response, send_from_directory
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
-import os
 
 from backend.ble_manager import BLEManager
+from backend.utils import ojsonify
 from src.core.logger import setup_logger
 
 # ロガー設定（環境変数LOG_LEVELで制御可能、デフォルトはINFO）
 log_level = os.environ.get('LOG_LEVEL', 'INFO')
 setup_logger(log_level)
 logger = logging.getLogger(__name__)
-logger.info(f"ログレベル: {log_level}")
+logger.info("ログレベル: %s", log_level)
 
 # Flaskアプリ作成
 app = Flask(__name__, static_folder='../frontend/dist')
@@ -24,7 +35,16 @@ CORS(app)
 # SocketIO初期化
 # 本番環境では環境変数CORS_ORIGINSを設定してください（例: "https://yourdomain.com"）
 allowed_origins = os.environ.get('CORS_ORIGINS', 'http://localhost:3000,http://localhost:5000').split(',')
-socketio = SocketIO(app, cors_allowed_origins=allowed_origins, async_mode='threading')
+# 環境変数SOCKETIO_MESSAGE_QUEUEを設定すると（例: "redis://localhost:6379/0"）、
+# emitがメッセージキューへのPUBLISHになり、クライアント数に依存しない
+# ファンアウトとマルチワーカー構成が可能になる
+message_queue = os.environ.get('SOCKETIO_MESSAGE_QUEUE')
+socketio = SocketIO(
+    app,
+    cors_allowed_origins=allowed_origins,
+    async_mode=async_mode,
+    message_queue=message_queue
+)
 
 # BLEマネージャー初期化
 ble_manager = BLEManager()
@@ -35,7 +55,7 @@ def init_event_handlers():
 
     def on_throw(throw_data):
         """投擲データをWebSocketで配信"""
-        logger.debug(f"投擲データをWebSocketで配信: {throw_data.get('segment_name')}")
+        logger.debug("投擲データをWebSocketで配信: %s", throw_data.get('segment_name'))
         socketio.emit('throw', throw_data)
 
     def on_player_change(data):
@@ -45,12 +65,12 @@ def init_event_handlers():
 
     def on_ble_connected(data):
         """BLE接続成功をWebSocketで配信"""
-        logger.info(f"BLE接続成功: {data.get('device_name')}")
+        logger.info("BLE接続成功: %s", data.get('device_name'))
         socketio.emit('ble_connected', data)
 
     def on_ble_error(data):
         """BLEエラーをWebSocketで配信"""
-        logger.error(f"BLEエラー: {data.get('message')}")
+        logger.error("BLEエラー: %s", data.get('message'))
         socketio.emit('ble_error', data)
 
     # EventBusに購読登録
@@ -65,12 +85,19 @@ def init_event_handlers():
 # イベントハンドラー初期化
 init_event_handlers()
 
+# gunicorn等のWSGIサーバー経由ではstart_web_server()を通らずBLE接続が
+# 始まらないため、BLE_AUTOSTART=1でインポート時に開始できるようにする
+# （start_background側に二重起動ガードあり）
+if os.environ.get('BLE_AUTOSTART') == '1':
+    logger.info("BLE_AUTOSTART=1: BLE接続をバックグラウンドで開始")
+    ble_manager.start_background()
+
 
 # WebSocketイベント
 @socketio.on('connect')
 def handle_connect():
     """クライアント接続時"""
-    logger.info(f"クライアントが接続しました")
+    logger.info("クライアントが接続しました")
     # BLE接続状態を送信
     emit('ble_status', ble_manager.get_status())
 
@@ -78,7 +105,7 @@ def handle_connect():
 @socketio.on('disconnect')
 def handle_disconnect():
     """クライアント切断時"""
-    logger.info(f"クライアントが切断しました")
+    logger.info("クライアントが切断しました")
 
 
 @socketio.on('request_status')
@@ -97,24 +124,50 @@ app.register_blueprint(stats_bp)
 app.register_blueprint(games_bp)
 
 # REST APIルート
+# ヘルスチェックは内容が固定なのでボディだけ事前シリアライズしておく。
+# Responseオブジェクト自体はafter_requestフック（flask-cors等）に
+# 書き換えられるため使い回さず、リクエストごとに生成する
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """ヘルスチェック"""
-    return jsonify({'status': 'ok'})
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 
 @app.route('/api/ble/status', methods=['GET'])
 def ble_status():
     """BLE接続状態"""
-    return jsonify(ble_manager.get_status())
+    return ojsonify(ble_manager.get_status())
+
+
+@app.route('/api/ble/stats', methods=['GET'])
+def ble_pipeline_stats():
+    """BLE処理パイプラインの計測値（チューニング用）"""
+    return ojsonify(ble_manager.get_pipeline_stats())
 
 
 # フロントエンドの配信（本番用）
+def _collect_static_files(folder):
+    """ビルド済み静的ファイルの一覧を起動時に走査（リクエストごとのstatを省く）"""
+    files = set()
+    if folder and os.path.isdir(folder):
+        for root, _dirs, names in os.walk(folder):
+            for name in names:
+                rel = os.path.relpath(os.path.join(root, name), folder)
+                files.add(rel.replace(os.sep, '/'))
+    return frozenset(files)
+
+
+_static_files = _collect_static_files(app.static_folder)
+
+
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
 def serve_frontend(path):
     """Reactアプリケーションを配信"""
-    if path != "" and os.path.exists(os.path.join(app.static_folder, path)):
+    if path in _static_files:
         return send_from_directory(app.static_folder, path)
     else:
         return send_from_directory(app.static_folder, 'index.html')
@@ -131,11 +184,16 @@ def start_web_server(host='0.0.0.0', port=5000, debug=False):
     ble_manager.start_background()
 
     # Webサーバー起動
-    logger.info(f"Webサーバーを起動: http://{host}:{port}")
+    logger.info("Webサーバーを起動: http://%s:%s", host, port)
     # BLE接続との競合を避けるため、デバッグモードでもリローダーは無効化
     # 本番環境ではallow_unsafe_werkzeugを無効化（debugフラグに連動）
     socketio.run(app, host=host, port=port, debug=debug, use_reloader=False, allow_unsafe_werkzeug=debug)
 
 
+def main():
+    """console_scripts用のエントリーポイント（darts-webコマンド）"""
+    start_web_server(host='0.0.0.0', port=5000)
+
+
 if __name__ == '__main__':
     start_web_server(debug=True)
@@ -1,63 +1,114 @@
 """BLE接続を管理し、イベントバスでデータを配信"""
 
 import asyncio
+import collections
 import logging
 import threading
-import queue
+import time
 from datetime import datetime
 from typing import Optional
 
+try:
+    # 任意の高速化オプション（POSIXのみ）。インストールされていればBLEループに使う
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from src.ble.scanner import DartsLiveScanner
 from src.ble.client import DartsLiveClient
 from src.data.mapper import SegmentMapper
-from src.data.storage import DartDatabase
 from src.data.models import DartThrow
-from src.core.config import AppConfig
 from backend.event_bus import EventBus
+from backend.cache import bump_generation
+from backend.deps import config, db
 
 logger = logging.getLogger(__name__)
 
 
+class ThrowEvent:
+    """キュー経由でワーカーに渡す投擲イベント（dictより軽量な固定スロット）"""
+
+    __slots__ = ('segment_code', 'ts_ns', 'device_address', 'device_name')
+
+    def __init__(
+        self,
+        segment_code: int,
+        ts_ns: int,
+        device_address: str,
+        device_name: str
+    ):
+        self.segment_code = segment_code
+        self.ts_ns = ts_ns
+        self.device_address = device_address
+        self.device_name = device_name
+
+
 class BLEManager:
-    """BLE接続をシングルトンとして管理"""
+    """
+    BLE接続を管理
 
-    _instance = None
-    _lock = threading.Lock()
+    インスタンスはbackend.appがモジュールスコープで1つだけ生成する。
+    （以前の__new__によるシングルトン + ロックは廃止）
+    """
 
-    def __new__(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-        return cls._instance
+    # ワーカーが1トランザクションでまとめて保存する最大件数
+    SAVE_BATCH_MAX = 100
 
-    def __init__(self):
-        # スレッドセーフな初期化チェック
-        with self._lock:
-            if hasattr(self, '_initialized'):
-                return
-            self._initialized = True
+    # 処理キューの最大保持件数
+    QUEUE_MAX = 1000
 
-        # 初期化処理
-        self.config = AppConfig()
+    def __init__(self):
+        # 初期化処理（DB・設定はbackend.depsの共有インスタンスを使用）
+        self.config = config
         self.scanner = DartsLiveScanner(
             scan_timeout=self.config.scan_timeout,
             retry_max=self.config.scan_retry_max,
-            retry_delay=self.config.scan_retry_delay
+            retry_delay=self.config.scan_retry_delay,
+            retry_max_delay=self.config.retry_max_delay
         )
         self.client: Optional[DartsLiveClient] = None
         self.mapper = SegmentMapper()
-        self.database = DartDatabase(self.config.db_path)
+        self.database = db
         self.event_bus = EventBus()
 
         self.is_running = False
         self._worker_running = True
         self._thread: Optional[threading.Thread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 接続監視・停止用のイベント（ループスレッド内で生成される）
+        self._stop_evt: Optional[asyncio.Event] = None
+        self._disconnected_evt: Optional[asyncio.Event] = None
         self.device_address = ""
         self.device_name = ""
 
+        # 受信時刻の基準点。通知ハンドラーではmonotonic_nsだけを取り、
+        # 壁時計への換算はワーカー側で行う（datetime.now()より大幅に軽い）
+        self._base_wall = time.time()
+        self._base_mono_ns = time.monotonic_ns()
+
+        # プレイヤー交代ボタン（0x54）のセグメント情報は固定なので先に引いておく
+        self._change_info = self.mapper.get_segment_info(0x54)
+        self._change_score = self.mapper.get_score(0x54)
+
+        # 処理パイプラインの計測カウンター（デコード・保存・配信の累積時間）
+        # 更新はワーカースレッドのみが行う
+        self._pipeline_stats = {
+            'throws': 0,
+            'decode_ns': 0,
+            'save_ns': 0,
+            'publish_ns': 0
+        }
+
+        # get_status結果のキャッシュ（状態が変わらない限り同じ辞書を返す）
+        self._status_cache: Optional[dict] = None
+        self._status_key: Optional[tuple] = None
+
         # 投擲データ処理用のキューとワーカースレッド（最大1000件）
-        self._processing_queue: queue.Queue = queue.Queue(maxsize=1000)
+        # deque.append/popleftはCPythonでアトミックなので、単一生産者・
+        # 単一消費者のこの経路ではqueue.Queueのロック+Condition通知を省ける
+        self._processing_queue: collections.deque = collections.deque(maxlen=self.QUEUE_MAX)
+        self._queue_event = threading.Event()
         self._processing_thread = threading.Thread(
             target=self._process_throws_worker,
             daemon=True
@@ -78,18 +129,37 @@ class BLEManager:
 
     def _run_ble_loop(self) -> None:
         """BLEイベントループを別スレッドで実行"""
-        self._loop = asyncio.new_event_loop()
+        if uvloop is not None:
+            # libuvベースのCイベントループで通知コールバックのオーバーヘッドを削減
+            self._loop = uvloop.new_event_loop()
+        else:
+            self._loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
 
         try:
             self._loop.run_until_complete(self._connect_and_listen())
         except Exception as e:
-            logger.error(f"BLEループでエラーが発生: {e}")
+            logger.error("BLEループでエラーが発生: %s", e)
         finally:
             self._loop.close()
 
+    async def _wait_or_stop(self, timeout: float) -> None:
+        """stop()が呼ばれるまで最大timeout秒待機（停止要求で即座に起きる）"""
+        try:
+            await asyncio.wait_for(self._stop_evt.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _on_disconnect(self, _client) -> None:
+        """bleakの切断コールバック（監視ループを起こす）"""
+        if self._loop and self._disconnected_evt:
+            self._loop.call_soon_threadsafe(self._disconnected_evt.set)
+
     async def _connect_and_listen(self) -> None:
         """デバイスに接続してデータをリッスン（自動再接続付き）"""
+        # asyncio.Eventはループに紐づくため、ループスレッド内で生成する
+        self._stop_evt = asyncio.Event()
+        self._disconnected_evt = asyncio.Event()
         reconnect_attempt = 0
 
         while self.is_running or reconnect_attempt == 0:
@@ -109,21 +179,23 @@ class BLEManager:
 
                     # 再スキャン前に待機
                     logger.info("5秒後に再スキャンします...")
-                    await asyncio.sleep(5)
+                    await self._wait_or_stop(5)
                     continue
 
                 self.device_address = device.address
                 self.device_name = device.name or "Unknown"
 
-                logger.info(f"デバイスに接続中: {self.device_name} ({self.device_address})")
+                logger.info("デバイスに接続中: %s (%s)", self.device_name, self.device_address)
                 self.client = DartsLiveClient(
                     device=device,
                     connection_timeout=self.config.connection_timeout,
                     reconnect_retry_max=self.config.reconnect_retry_max,
-                    reconnect_delay=self.config.reconnect_delay
+                    reconnect_delay=self.config.reconnect_delay,
+                    retry_max_delay=self.config.retry_max_delay
                 )
 
-                self.client.set_data_callback(self._on_throw_data)
+                self.client.set_data_callback(self._make_data_callback())
+                self.client.set_disconnected_callback(self._on_disconnect)
 
                 if not await self.client.connect_with_retry():
                     logger.error("BLE接続に失敗しました")
@@ -137,7 +209,7 @@ class BLEManager:
 
                     # 再接続前に待機
                     logger.info("5秒後に再接続を試みます...")
-                    await asyncio.sleep(5)
+                    await self._wait_or_stop(5)
                     continue
 
                 # 接続成功
@@ -151,22 +223,27 @@ class BLEManager:
                 self.is_running = True
                 reconnect_attempt = 0
 
-                # 接続監視ループ
+                # 接続監視: 切断コールバックか停止要求まで待機
+                # （1秒ごとのポーリングと違い、接続中はウェイクアップゼロで
+                # 切断への反応も即時）
                 logger.info("接続を監視中...")
-                while self.is_running:
-                    # 接続状態をチェック（詳細ログ付き）
-                    is_connected = self.client.is_connected
-                    logger.debug(f"接続状態チェック: is_connected={is_connected}, is_running={self.is_running}")
-
-                    if not is_connected:
-                        logger.warning("BLE接続が切断されました")
-                        self.event_bus.publish('ble_error', {
-                            'error': 'connection_lost',
-                            'message': 'BLE接続が切断されました'
-                        })
-                        break
+                self._disconnected_evt.clear()
+                waiters = [
+                    asyncio.ensure_future(self._disconnected_evt.wait()),
+                    asyncio.ensure_future(self._stop_evt.wait()),
+                ]
+                try:
+                    await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    for waiter in waiters:
+                        waiter.cancel()
 
-                    await asyncio.sleep(1)
+                if self._disconnected_evt.is_set():
+                    logger.warning("BLE接続が切断されました")
+                    self.event_bus.publish('ble_error', {
+                        'error': 'connection_lost',
+                        'message': 'BLE接続が切断されました'
+                    })
 
                 # クリーンアップ
                 logger.info("接続をクリーンアップ中...")
@@ -174,13 +251,13 @@ class BLEManager:
                     await self.client.stop_notify()
                     logger.info("通知を停止しました")
                 except Exception as e:
-                    logger.error(f"通知停止中にエラー: {e}")
+                    logger.error("通知停止中にエラー: %s", e)
 
                 try:
                     await self.client.disconnect()
                     logger.info("切断しました")
                 except Exception as e:
-                    logger.error(f"切断中にエラー: {e}")
+                    logger.error("切断中にエラー: %s", e)
 
                 # 手動停止の場合は終了
                 if not self.is_running:
@@ -189,11 +266,11 @@ class BLEManager:
 
                 # 自動再接続
                 reconnect_attempt += 1
-                logger.info(f"再接続を試みます (試行 {reconnect_attempt})...")
-                await asyncio.sleep(3)
+                logger.info("再接続を試みます (試行 %d)...", reconnect_attempt)
+                await self._wait_or_stop(3)
 
             except Exception as e:
-                logger.error(f"BLE接続中に予期しないエラー: {e}")
+                logger.error("BLE接続中に予期しないエラー: %s", e)
                 self.event_bus.publish('ble_error', {
                     'error': 'unexpected_error',
                     'message': f'予期しないエラー: {str(e)}'
@@ -203,108 +280,174 @@ class BLEManager:
                     break
 
                 logger.info("5秒後に再接続を試みます...")
-                await asyncio.sleep(5)
+                await self._wait_or_stop(5)
+
+    def _make_data_callback(self):
+        """
+        BLE通知用の軽量コールバックを生成
+
+        通知のたびに行われるself経由の属性参照・メソッド解決を、接続時に
+        一度だけクロージャのローカル変数に束縛しておく。デバイス情報も
+        接続時点で確定しているため毎回読み直す必要がない。
+
+        Returns:
+            セグメントコードを受け取りキューに積むコールバック
+        """
+        queue = self._processing_queue
+        append = queue.append
+        notify = self._queue_event.set
+        monotonic_ns = time.monotonic_ns
+        queue_max = self.QUEUE_MAX
+        device_address = self.device_address
+        device_name = self.device_name
+
+        def on_data(segment_code: int) -> None:
+            if len(queue) >= queue_max:
+                logger.error("処理キューが満杯です。投擲データを破棄しました")
+                return
+
+            append(ThrowEvent(segment_code, monotonic_ns(), device_address, device_name))
+            notify()
+
+        return on_data
 
     def _on_throw_data(self, segment_code: int) -> None:
         """
         投擲データを受信してキューに追加（ノンブロッキング）
 
+        実際の接続では_make_data_callbackが生成するクロージャが使われる。
+        こちらはテストや手動投入用のフックとして残している。
+
         Args:
             segment_code: BLEデバイスから受信したセグメントコード
         """
         try:
-            logger.debug(f"_on_throw_data開始: segment_code=0x{segment_code:02x}")
+            logger.debug("_on_throw_data開始: segment_code=0x%02x", segment_code)
 
             # キューに入れるだけ（BLE通知ハンドラーをブロックしない）
-            self._processing_queue.put_nowait({
-                'segment_code': segment_code,
-                'timestamp': datetime.now(),
-                'device_address': self.device_address,
-                'device_name': self.device_name
-            })
-            logger.debug(f"投擲データをキューに追加完了: 0x{segment_code:02x}")
-        except queue.Full:
-            logger.error("処理キューが満杯です。投擲データを破棄しました")
+            if len(self._processing_queue) >= self.QUEUE_MAX:
+                logger.error("処理キューが満杯です。投擲データを破棄しました")
+                return
+
+            self._processing_queue.append(ThrowEvent(
+                segment_code,
+                time.monotonic_ns(),
+                self.device_address,
+                self.device_name
+            ))
+            self._queue_event.set()
+            logger.debug("投擲データをキューに追加完了: 0x%02x", segment_code)
         except Exception as e:
-            logger.error(f"投擲データのキューイング中にエラー: {e}", exc_info=True)
+            logger.error("投擲データのキューイング中にエラー: %s", e, exc_info=True)
 
     def _process_throws_worker(self) -> None:
         """
         投擲データを処理するワーカースレッド
-        キューから投擲データを取り出してDB保存とイベント配信を行う
+        キューから投擲データをバッチで取り出してDB保存とイベント配信を行う
         """
         logger.info("投擲データ処理ワーカーを開始しました")
 
         while self._worker_running:
             try:
-                # キューから取得（タイムアウト付き）
-                try:
-                    throw_data = self._processing_queue.get(timeout=1.0)
-                except queue.Empty:
-                    continue  # タイムアウト時は停止フラグを再チェック
-
-                try:
-                    segment_code = throw_data['segment_code']
-                    timestamp = throw_data['timestamp']
-                    device_address = throw_data['device_address']
-                    device_name = throw_data['device_name']
-
-                    # セグメント情報を取得
-                    base_number, multiplier, segment_name = self.mapper.get_segment_info(segment_code)
-                    score = self.mapper.get_score(segment_code)
-
-                    # プレイヤー交代ボタンの特殊処理
-                    if segment_code == 0x54:
-                        logger.info("プレイヤー交代ボタンが押されました")
-                        self.event_bus.publish('player_change', {
-                            'segment_code': segment_code,
-                            'timestamp': timestamp.isoformat()
-                        })
-
-                        # プレイヤー交代もDBに記録
-                        throw = DartThrow(
-                            timestamp=timestamp,
-                            segment_code=segment_code,
-                            segment_name=segment_name,
-                            base_number=base_number,
-                            multiplier=multiplier,
-                            score=score,
-                            device_address=device_address,
-                            device_name=device_name
-                        )
-                        self.database.save_throw(throw)
+                if not self._processing_queue:
+                    # 新着を待機（タイムアウト付きで停止フラグを再チェック）
+                    if not self._queue_event.wait(timeout=1.0):
                         continue
+                    self._queue_event.clear()
+
+                # 溜まっている分をまとめて取り出し、DB書き込みを1トランザクションに集約
+                batch = []
+                while self._processing_queue and len(batch) < self.SAVE_BATCH_MAX:
+                    batch.append(self._processing_queue.popleft())
+
+                if batch:
+                    self._process_throw_batch(batch)
+
+            except Exception as e:
+                logger.error("投擲データ処理中にエラーが発生: %s", e)
+                # エラーが発生してもワーカースレッドは停止しない
+
+        logger.info("投擲データ処理ワーカーを停止しました")
 
-                    # DartThrowモデルを作成
-                    throw = DartThrow(
-                        timestamp=timestamp,
-                        segment_code=segment_code,
-                        segment_name=segment_name,
-                        base_number=base_number,
-                        multiplier=multiplier,
-                        score=score,
-                        device_address=device_address,
-                        device_name=device_name
+    def _process_throw_batch(self, batch: list) -> None:
+        """
+        投擲データのバッチを処理
+
+        Args:
+            batch: キューから取り出した投擲データのリスト
+        """
+        decode_start = time.perf_counter_ns()
+
+        throws = []
+        for event in batch:
+            segment_code = event.segment_code
+
+            # monotonic基準点からのオフセットで壁時計時刻を復元
+            timestamp = datetime.fromtimestamp(
+                self._base_wall + (event.ts_ns - self._base_mono_ns) / 1e9
+            )
+
+            # プレイヤー交代ボタンはUI即応性優先: マッパー参照もDB保存も
+            # 待たずに先に配信し、セグメント情報は事前計算済みの定数を使う
+            if segment_code == 0x54:
+                logger.info("プレイヤー交代ボタンが押されました")
+                self.event_bus.publish('player_change', {
+                    'segment_code': segment_code,
+                    'timestamp': timestamp.isoformat()
+                })
+                base_number, multiplier, segment_name = self._change_info
+                score = self._change_score
+            else:
+                # セグメント情報と得点を1回の参照でまとめて取得
+                segment = self.mapper.lookup(segment_code)
+                if segment is None:
+                    logger.warning("未知のセグメントコード: 0x%02x", segment_code)
+                    base_number, multiplier, segment_name, score = (
+                        None, None, f"不明(0x{segment_code:02x})", None
                     )
+                else:
+                    base_number, multiplier, segment_name, score = segment
 
-                    # データベースに保存
-                    throw_id = self.database.save_throw(throw)
-                    throw.id = throw_id
+            # DartThrowモデルを作成（プレイヤー交代もDBに記録）
+            throws.append(DartThrow(
+                timestamp=timestamp,
+                segment_code=segment_code,
+                segment_name=segment_name,
+                base_number=base_number,
+                multiplier=multiplier,
+                score=score,
+                device_address=event.device_address,
+                device_name=event.device_name
+            ))
 
-                    logger.info(f"投擲検出: {segment_name} ({score}点) [ID: {throw_id}]")
+        save_start = time.perf_counter_ns()
 
-                    # イベントバスで配信
-                    self.event_bus.publish('throw', throw.to_dict())
+        # データベースにまとめて保存
+        throw_ids = self.database.save_throws(throws)
 
-                finally:
-                    # 必ずtask_done()を呼ぶ
-                    self._processing_queue.task_done()
+        # 統計APIのキャッシュを無効化
+        bump_generation()
 
-            except Exception as e:
-                logger.error(f"投擲データ処理中にエラーが発生: {e}")
-                # エラーが発生してもワーカースレッドは停止しない
+        publish_start = time.perf_counter_ns()
 
-        logger.info("投擲データ処理ワーカーを停止しました")
+        # イベントバスで配信
+        for throw, throw_id in zip(throws, throw_ids):
+            throw.id = throw_id
+
+            if throw.segment_code == 0x54:
+                continue
+
+            logger.info("投擲検出: %s (%s点) [ID: %s]", throw.segment_name, throw.score, throw_id)
+            self.event_bus.publish('throw', throw.to_dict())
+
+        publish_end = time.perf_counter_ns()
+
+        # 計測値を蓄積（/api/ble/statsで参照）
+        stats = self._pipeline_stats
+        stats['throws'] += len(batch)
+        stats['decode_ns'] += save_start - decode_start
+        stats['save_ns'] += publish_start - save_start
+        stats['publish_ns'] += publish_end - publish_start
 
     def stop(self) -> None:
         """BLE接続を停止"""
@@ -312,6 +455,10 @@ class BLEManager:
         self.is_running = False
         self._worker_running = False
 
+        # 監視ループ・バックオフ待機を即座に起こす
+        if self._loop and self._loop.is_running() and self._stop_evt:
+            self._loop.call_soon_threadsafe(self._stop_evt.set)
+
         # BLE接続をクリーンアップ
         if self.client and self._loop and self._loop.is_running():
             # 通知を停止してから切断する
@@ -320,18 +467,18 @@ class BLEManager:
                     await self.client.stop_notify()
                     logger.info("通知を停止しました")
                 except Exception as e:
-                    logger.error(f"通知停止中にエラー: {e}")
+                    logger.error("通知停止中にエラー: %s", e)
 
                 try:
                     await self.client.disconnect()
                 except Exception as e:
-                    logger.error(f"切断中にエラー: {e}")
+                    logger.error("切断中にエラー: %s", e)
 
             future = asyncio.run_coroutine_threadsafe(cleanup(), self._loop)
             try:
                 future.result(timeout=10)
             except Exception as e:
-                logger.error(f"クリーンアップ中にエラーが発生: {e}")
+                logger.error("クリーンアップ中にエラーが発生: %s", e)
 
         # ワーカースレッドの停止を待つ
         if self._processing_thread and self._processing_thread.is_alive():
@@ -340,11 +487,38 @@ class BLEManager:
 
         logger.info("BLE接続を停止しました")
 
+    def get_pipeline_stats(self) -> dict:
+        """
+        投擲処理パイプラインの計測値を取得
+
+        Returns:
+            累積カウンターと1投あたりの平均時間(µs)の辞書
+        """
+        stats = dict(self._pipeline_stats)
+        throws = stats['throws']
+
+        stats['avg_decode_us'] = stats['decode_ns'] / throws / 1000 if throws else 0.0
+        stats['avg_save_us'] = stats['save_ns'] / throws / 1000 if throws else 0.0
+        stats['avg_publish_us'] = stats['publish_ns'] / throws / 1000 if throws else 0.0
+
+        return stats
+
     def get_status(self) -> dict:
-        """BLE接続状態を取得"""
-        return {
-            'is_running': self.is_running,
-            'is_connected': self.client.is_connected if self.client else False,
-            'device_address': self.device_address,
-            'device_name': self.device_name
-        }
+        """BLE接続状態を取得（状態が変わらない限りキャッシュした辞書を返す）"""
+        key = (
+            self.is_running,
+            self.client.is_connected if self.client else False,
+            self.device_address,
+            self.device_name
+        )
+
+        if self._status_cache is None or self._status_key != key:
+            self._status_key = key
+            self._status_cache = {
+                'is_running': key[0],
+                'is_connected': key[1],
+                'device_address': key[2],
+                'device_name': key[3]
+            }
+
+        return self._status_cache
@@ -0,0 +1,77 @@
+"""統計APIレスポンスの簡易キャッシュ"""
+
+import functools
+import logging
+import threading
+import time
+
+from flask import Response, make_response, request
+
+logger = logging.getLogger(__name__)
+
+# キャッシュ本体: キー -> (有効期限, ボディbytes, ステータス, mimetype)
+# Responseオブジェクトはafter_requestフック（flask-cors等）に毎回
+# 書き換えられるため共有せず、シリアライズ済みの中身だけを持つ
+_cache: dict = {}
+_lock = threading.Lock()
+
+# 世代カウンター（投擲データ追加時に進めて一括無効化）
+_generation = 0
+
+
+def bump_generation() -> None:
+    """キャッシュ世代を進めて既存エントリを一括無効化"""
+    global _generation
+    with _lock:
+        _generation += 1
+        _cache.clear()
+
+
+def cached(ttl: float = 5.0):
+    """
+    FlaskビューのレスポンスをTTL付きでキャッシュするデコレーター
+
+    キーは (世代, パス, クエリパラメータ)。新しい投擲が保存されると
+    bump_generation()で世代が進み、古いエントリは参照されなくなるため、
+    読み取り中心のワークロードでは集計クエリが辞書参照1回に置き換わる。
+
+    Args:
+        ttl: キャッシュ有効期間(秒)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (_generation, request.path, tuple(sorted(request.args.items())))
+            now = time.monotonic()
+
+            with _lock:
+                entry = _cache.get(key)
+            if entry and entry[0] > now:
+                logger.debug("キャッシュヒット: %s", request.path)
+                # キャッシュした中身から毎回新しいResponseを組み立てる
+                _expires, body, status, mimetype = entry
+                return Response(body, status=status, mimetype=mimetype)
+
+            # タプル返し（ojsonify(...), 400等）もResponseに正規化する
+            response = make_response(func(*args, **kwargs))
+
+            # エラーレスポンスはキャッシュしない（一時的なDBエラー等を
+            # TTLの間リプレイしてしまわないよう、毎回ビューを実行し直す）
+            if response.status_code != 200:
+                return response
+
+            with _lock:
+                # 期限切れエントリを掃除する（キーにクエリ文字列が入るため、
+                # 放置すると世代が進むまで増え続ける）
+                expired = [k for k, v in _cache.items() if v[0] <= now]
+                for k in expired:
+                    del _cache[k]
+                _cache[key] = (
+                    now + ttl,
+                    response.get_data(),
+                    response.status_code,
+                    response.mimetype
+                )
+            return response
+        return wrapper
+    return decorator
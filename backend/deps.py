@@ -0,0 +1,15 @@
+"""バックエンド全体で共有するリソースの初期化"""
+
+import logging
+
+from src.core.config import AppConfig
+from src.data.storage import DartDatabase
+from src.data.analyzer import DartAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Blueprint・BLEマネージャー間で共有する単一インスタンス
+# （モジュールごとに生成すると接続セットアップとスキーマ初期化が重複する）
+config = AppConfig()
+db = DartDatabase(config.db_path)
+analyzer = DartAnalyzer(db)
@@ -1,7 +1,9 @@
 """Pub/Subパターンによるイベントバス"""
 
+import collections
 import logging
-from typing import Callable, Dict, List
+import threading
+from typing import Callable, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +12,20 @@ class EventBus:
     """イベント駆動アーキテクチャのためのイベントバス"""
 
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
+        # 購読者はタプルで保持し、subscribe/unsubscribe時に作り直す。
+        # 購読は起動時のみ・発行は投擲ごとに起こるread-mostly構造なので、
+        # 発行側はロックなしでタプルのスナップショットを安全に参照できる
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
+
+        # 配信キュー: publishはappendのみで、購読者の実行は専用スレッドが担う
+        # （バースト時も発行側はO(1)で完了する）
+        self._queue: collections.deque = collections.deque()
+        self._event = threading.Event()
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_worker,
+            daemon=True
+        )
+        self._dispatch_thread.start()
 
     def subscribe(self, event_type: str, callback: Callable) -> None:
         """
@@ -20,11 +35,9 @@ class EventBus:
             event_type: イベントの種類（例: 'throw', 'player_change'）
             callback: イベント発生時に呼び出される関数
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-
-        self._subscribers[event_type].append(callback)
-        logger.debug(f"イベント購読: {event_type}")
+        current = self._subscribers.get(event_type, ())
+        self._subscribers[event_type] = (*current, callback)
+        logger.debug("イベント購読: %s", event_type)
 
     def unsubscribe(self, event_type: str, callback: Callable) -> None:
         """
@@ -34,29 +47,47 @@ class EventBus:
             event_type: イベントの種類
             callback: 登録解除するコールバック関数
         """
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(callback)
-                logger.debug(f"イベント購読解除: {event_type}")
-            except ValueError:
-                logger.warning(f"購読解除: コールバックが見つかりません: {event_type}")
+        current = self._subscribers.get(event_type, ())
+        if callback in current:
+            self._subscribers[event_type] = tuple(
+                cb for cb in current if cb is not callback
+            )
+            logger.debug("イベント購読解除: %s", event_type)
+        else:
+            logger.warning("購読解除: コールバックが見つかりません: %s", event_type)
 
     def publish(self, event_type: str, data: dict) -> None:
         """
-        イベントを発行し、すべての購読者に通知
+        イベントを発行（キューに積むだけで、通知は配信スレッドが行う）
 
         Args:
             event_type: イベントの種類
             data: イベントデータ
         """
-        if event_type not in self._subscribers:
-            logger.debug(f"購読者なし: {event_type}")
+        if not self._subscribers.get(event_type):
             return
 
-        logger.info(f"イベント発行: {event_type}, 購読者数: {len(self._subscribers[event_type])}")
+        self._queue.append((event_type, data))
+        self._event.set()
+
+    def _dispatch_worker(self) -> None:
+        """キューからイベントを取り出して購読者に通知する配信スレッド"""
+        while True:
+            self._event.wait()
+            self._event.clear()
+
+            while self._queue:
+                event_type, data = self._queue.popleft()
+                subscribers = self._subscribers.get(event_type, ())
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "イベント配信: %s, 購読者数: %d",
+                        event_type, len(subscribers)
+                    )
 
-        for callback in self._subscribers[event_type]:
-            try:
-                callback(data)
-            except Exception as e:
-                logger.error(f"イベントハンドラーでエラー: {event_type}, {e}")
+                for callback in subscribers:
+                    try:
+                        callback(data)
+                    except Exception as e:
+                        logger.error("イベントハンドラーでエラー: %s, %s", event_type, e)
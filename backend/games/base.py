@@ -14,14 +14,19 @@ class Player:
         self.order = order
         self.is_current = False
 
-    def to_dict(self) -> dict:
-        return {
-            'id': self.id,
-            'name': self.name,
-            'order': self.order,
-            'is_current': self.is_current
+        # to_dict用キャッシュ（id/name/orderは不変、is_currentのみ更新される）
+        self._cached_dict = {
+            'id': player_id,
+            'name': name,
+            'order': order,
+            'is_current': False
         }
 
+    def to_dict(self) -> dict:
+        """辞書表現を取得（キャッシュ、読み取り専用）"""
+        self._cached_dict['is_current'] = self.is_current
+        return self._cached_dict
+
 
 class BaseGame(ABC):
     """ゲーム基底クラス"""
@@ -35,6 +40,10 @@ class BaseGame(ABC):
         self.winner: Optional[Player] = None
         self.created_at = datetime.now()
 
+        # get_state用キャッシュ（created_atは不変、プレイヤー一覧は交代時のみ変化）
+        self._created_at_iso = self.created_at.isoformat()
+        self._players_dict_cache: Optional[List[dict]] = None
+
         # 最初のプレイヤーを現在プレイヤーに設定
         if self.players:
             self.players[0].is_current = True
@@ -63,21 +72,36 @@ class BaseGame(ABC):
         # 新しい現在プレイヤーのフラグをオン
         self.players[self.current_player_index].is_current = True
 
+        # キャッシュ済み辞書のis_currentも追従させる（再構築せずに更新）
+        for player in self.players:
+            player._cached_dict['is_current'] = player.is_current
+
         return self.get_current_player()
 
     def get_current_player(self) -> Player:
         """現在のプレイヤーを取得"""
         return self.players[self.current_player_index]
 
+    def _players_view(self) -> List[dict]:
+        """プレイヤー一覧の辞書ビューを取得（キャッシュ、読み取り専用）"""
+        if self._players_dict_cache is None:
+            self._players_dict_cache = [p.to_dict() for p in self.players]
+        return self._players_dict_cache
+
     def get_state(self) -> dict:
-        """ゲーム状態を取得"""
+        """
+        ゲーム状態を取得
+
+        返り値のplayersはキャッシュされたビューなので、呼び出し側は
+        読み取り専用として扱うこと。
+        """
         return {
             'game_id': self.game_id,
             'state': self.state,
-            'players': [p.to_dict() for p in self.players],
+            'players': self._players_view(),
             'current_player_index': self.current_player_index,
             'winner': self.winner.to_dict() if self.winner else None,
-            'created_at': self.created_at.isoformat()
+            'created_at': self._created_at_iso
         }
 
     def is_finished(self) -> bool:
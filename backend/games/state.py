@@ -29,6 +29,10 @@ class GameStateManager:
         self._initialized = True
         self.active_games: Dict[str, ZeroOneGame] = {}
 
+        # ゲームID -> 一覧表示用サマリー
+        # 作成時に構築し、状態が変わったときだけ更新する読み取り用スナップショット
+        self._summaries: Dict[str, dict] = {}
+
     def create_game(
         self,
         game_type: str,
@@ -60,12 +64,20 @@ class GameStateManager:
                 game_id=game_id,
                 players=players,
                 starting_score=settings.get('starting_score', 501),
-                finish_type=settings.get('finish_type', 'double')
+                finish_type=settings.get('finish_type', 'double'),
+                history_limit=settings.get('history_limit')
             )
         else:
             raise ValueError(f"未対応のゲームタイプ: {game_type}")
 
         self.active_games[game_id] = game
+        self._summaries[game_id] = {
+            'game_id': game_id,
+            'game_type': game_type,
+            'state': game.state,
+            'player_count': len(game.players),
+            'created_at': game._created_at_iso
+        }
         logger.info(f"ゲーム作成: {game_id}, タイプ: {game_type}, プレイヤー数: {len(players)}")
 
         return game_id
@@ -78,22 +90,14 @@ class GameStateManager:
         """ゲームを削除"""
         if game_id in self.active_games:
             del self.active_games[game_id]
+            self._summaries.pop(game_id, None)
             logger.info(f"ゲーム削除: {game_id}")
             return True
         return False
 
     def list_games(self) -> List[dict]:
-        """アクティブなゲーム一覧を取得"""
-        return [
-            {
-                'game_id': game_id,
-                'game_type': 'zero_one',
-                'state': game.state,
-                'player_count': len(game.players),
-                'created_at': game.created_at.isoformat()
-            }
-            for game_id, game in self.active_games.items()
-        ]
+        """アクティブなゲーム一覧を取得（維持済みスナップショットをそのまま返す）"""
+        return list(self._summaries.values())
 
     def handle_throw_for_game(self, game_id: str, throw_data: dict) -> Optional[Dict]:
         """
@@ -110,4 +114,11 @@ class GameStateManager:
         if not game:
             return None
 
-        return game.handle_throw(throw_data)
+        result = game.handle_throw(throw_data)
+
+        # 状態遷移（waiting -> playing -> finished）をスナップショットに反映
+        summary = self._summaries.get(game_id)
+        if summary is not None:
+            summary['state'] = game.state
+
+        return result
@@ -1,7 +1,9 @@
 """ゼロワンゲーム実装"""
 
+import collections
+import itertools
 import logging
-from typing import List, Dict
+from typing import Any, Dict, List, Optional
 from backend.games.base import BaseGame, Player
 
 logger = logging.getLogger(__name__)
@@ -10,15 +12,22 @@ logger = logging.getLogger(__name__)
 class ZeroOneGame(BaseGame):
     """ゼロワンゲーム（301/501/701等）"""
 
-    VALID_STARTING_SCORES = [301, 501, 701, 901, 1101, 1501]
-    VALID_FINISH_TYPES = ['straight', 'double', 'master']
+    VALID_STARTING_SCORES = frozenset({301, 501, 701, 901, 1101, 1501})
+    VALID_FINISH_TYPES = frozenset({'straight', 'double', 'master'})
+
+    # 履歴の最大保持ラウンド数（設定のhistory_limitで上書き可能）
+    DEFAULT_HISTORY_LIMIT = 512
+
+    # get_stateに含める直近ラウンド数（全履歴はget_full_historyで取得）
+    STATE_HISTORY_ROUNDS = 32
 
     def __init__(
         self,
         game_id: str,
         players: List[Player],
         starting_score: int = 501,
-        finish_type: str = 'double'
+        finish_type: str = 'double',
+        history_limit: Optional[int] = None
     ):
         """
         Args:
@@ -29,33 +38,58 @@ class ZeroOneGame(BaseGame):
                 - 'straight': 任意のセグメントで終了可能
                 - 'double': ダブルで終了（ダブルアウト）
                 - 'master': ダブルまたはトリプルで終了（マスターアウト）
+            history_limit: 履歴の最大保持ラウンド数
+                （省略時はDEFAULT_HISTORY_LIMIT）
         """
-        settings = {
+        if history_limit is None:
+            history_limit = self.DEFAULT_HISTORY_LIMIT
+
+        settings: Dict[str, Any] = {
             'starting_score': starting_score,
-            'finish_type': finish_type
+            'finish_type': finish_type,
+            'history_limit': history_limit
         }
         super().__init__(game_id, players, settings)
 
         # バリデーション
         if starting_score not in self.VALID_STARTING_SCORES:
-            raise ValueError(f"無効な開始点数: {starting_score}. 有効な値: {self.VALID_STARTING_SCORES}")
+            raise ValueError(f"無効な開始点数: {starting_score}. 有効な値: {sorted(self.VALID_STARTING_SCORES)}")
 
         if finish_type not in self.VALID_FINISH_TYPES:
-            raise ValueError(f"無効な終了条件: {finish_type}. 有効な値: {self.VALID_FINISH_TYPES}")
+            raise ValueError(f"無効な終了条件: {finish_type}. 有効な値: {sorted(self.VALID_FINISH_TYPES)}")
 
         self.starting_score = starting_score
         self.finish_type = finish_type
 
-        # 各プレイヤーの現在スコアを初期化
-        self.scores = {player.id: starting_score for player in players}
+        # フィニッシュ有効判定用の倍率セット（Noneは任意のセグメントで終了可）
+        self._valid_finish_multipliers = {
+            'straight': None,
+            'double': frozenset({2}),
+            'master': frozenset({2, 3})
+        }[finish_type]
+
+        # 各プレイヤーの現在スコア（current_player_indexで引く配列。
+        # 辞書のハッシュ参照より添字アクセスのほうが速い）
+        self._scores_list: List[int] = [starting_score] * len(players)
 
         # ラウンド管理
         self.round_count = 1
         self.current_round_throws: List[dict] = []
         self.max_throws_per_round = 3
 
-        # ゲーム履歴
-        self.history: List[dict] = []
+        # 現在ラウンドの得点合計（投擲ごとに加算、ラウンド終了でリセット）
+        self._round_score_accum = 0
+
+        # 各プレイヤーのラウンド開始時スコア（バースト時のO(1)復元用）
+        self._round_start_scores: List[int] = list(self._scores_list)
+
+        # ゲーム履歴（長時間セッションでも肥大しないよう上限付き）
+        self.history: collections.deque = collections.deque(maxlen=history_limit)
+
+    @property
+    def scores(self) -> Dict[int, int]:
+        """プレイヤーID→現在スコアの辞書（get_state等の互換ビュー）"""
+        return {p.id: self._scores_list[i] for i, p in enumerate(self.players)}
 
     def handle_throw(self, throw_data: dict) -> Dict:
         """
@@ -77,13 +111,16 @@ class ZeroOneGame(BaseGame):
             self.state = 'playing'
 
         current_player = self.get_current_player()
-        current_score = self.scores[current_player.id]
+        current_score = self._scores_list[self.current_player_index]
 
         # プレイヤー交代ボタン（0x54）の処理
         if throw_data.get('segment_code') == 0x54:
-            logger.info(f"プレイヤー交代: {current_player.name}")
+            logger.info("プレイヤー交代: %s", current_player.name)
             self.current_round_throws.clear()
+            self._round_score_accum = 0
             next_player = self.next_player()
+            self._round_start_scores[self.current_player_index] = \
+                self._scores_list[self.current_player_index]
 
             return {
                 'type': 'player_changed',
@@ -96,11 +133,12 @@ class ZeroOneGame(BaseGame):
         self.current_round_throws.append(throw_data)
 
         score = throw_data.get('score', 0)
+        self._round_score_accum += score
         new_score = current_score - score
 
         # バスト判定
         if new_score < 0:
-            logger.info(f"バースト! {current_player.name}: {current_score} - {score} = {new_score}")
+            logger.info("バースト! %s: %d - %d = %d", current_player.name, current_score, score, new_score)
             result = self._handle_bust(current_player, score)
             self._complete_round()
             return result
@@ -108,17 +146,17 @@ class ZeroOneGame(BaseGame):
         # 勝利判定
         if new_score == 0:
             if self._is_valid_finish(throw_data):
-                logger.info(f"勝利! {current_player.name}")
+                logger.info("勝利! %s", current_player.name)
                 return self._handle_win(current_player, score)
             else:
-                logger.info(f"無効なフィニッシュ! {current_player.name} (finish_type: {self.finish_type})")
+                logger.info("無効なフィニッシュ! %s (finish_type: %s)", current_player.name, self.finish_type)
                 result = self._handle_bust(current_player, score)
                 self._complete_round()
                 return result
 
         # スコア更新
-        self.scores[current_player.id] = new_score
-        logger.info(f"投擲: {current_player.name}, {throw_data['segment_name']} ({score}点), 残り: {new_score}")
+        self._scores_list[self.current_player_index] = new_score
+        logger.info("投擲: %s, %s (%d点), 残り: %d", current_player.name, throw_data['segment_name'], score, new_score)
 
         # 3投完了でラウンド終了
         if len(self.current_round_throws) >= self.max_throws_per_round:
@@ -131,7 +169,7 @@ class ZeroOneGame(BaseGame):
             'new_score': new_score,
             'throw': throw_data,
             'round_throws_count': len(self.current_round_throws),
-            'game_state': self.get_state()
+            'game_state': self.get_state_light()
         }
 
     def _is_valid_finish(self, throw_data: dict) -> bool:
@@ -144,16 +182,8 @@ class ZeroOneGame(BaseGame):
         Returns:
             有効な場合True
         """
-        multiplier = throw_data.get('multiplier', 0)
-
-        if self.finish_type == 'straight':
-            return True
-        elif self.finish_type == 'double':
-            return multiplier == 2
-        elif self.finish_type == 'master':
-            return multiplier in [2, 3]
-
-        return False
+        valid = self._valid_finish_multipliers
+        return valid is None or throw_data.get('multiplier', 0) in valid
 
     def _handle_bust(self, player: Player, score: int) -> Dict:
         """
@@ -166,24 +196,25 @@ class ZeroOneGame(BaseGame):
         Returns:
             処理結果
         """
-        # スコアを元に戻す（ラウンド開始時のスコア）
-        # 履歴からラウンド開始時のスコアを復元
-        round_start_score = self.scores[player.id]
-        for throw in self.current_round_throws[:-1]:  # 最後の投擲を除く
-            round_start_score += throw.get('score', 0)
+        # スコアを元に戻す（ラウンド開始時に取得済みのスナップショットで復元）
+        # バースト時のplayerは常に現在プレイヤー
+        round_start_score = self._round_start_scores[self.current_player_index]
+
+        self._scores_list[self.current_player_index] = round_start_score
 
-        self.scores[player.id] = round_start_score
+        # コピーせずリストごと履歴に移し、次ラウンド用に新しいリストを割り当てる
+        throws = self.current_round_throws
+        self.current_round_throws = []
+        self._round_score_accum = 0
 
         self.history.append({
             'round': self.round_count,
             'player_id': player.id,
             'player_name': player.name,
             'result': 'bust',
-            'throws': self.current_round_throws.copy()
+            'throws': throws
         })
 
-        self.current_round_throws.clear()
-
         return {
             'type': 'bust',
             'player': player.to_dict(),
@@ -204,17 +235,18 @@ class ZeroOneGame(BaseGame):
         """
         self.state = 'finished'
         self.winner = player
-        self.scores[player.id] = 0
+        self._scores_list[self.current_player_index] = 0
 
+        # コピーせずリストごと履歴に移す（ゲーム終了のためクリア不要）
         self.history.append({
             'round': self.round_count,
             'player_id': player.id,
             'player_name': player.name,
             'result': 'win',
-            'throws': self.current_round_throws.copy()
+            'throws': self.current_round_throws
         })
 
-        logger.info(f"ゲーム終了！勝者: {player.name}")
+        logger.info("ゲーム終了！勝者: %s", player.name)
 
         return {
             'type': 'game_finished',
@@ -227,19 +259,24 @@ class ZeroOneGame(BaseGame):
         """ラウンド完了処理"""
         current_player = self.get_current_player()
 
-        # 履歴に記録
-        round_score = sum(throw.get('score', 0) for throw in self.current_round_throws)
+        # 履歴に記録（合計は投擲ごとに加算済みの累計、リストはコピーせず移動）
+        round_score = self._round_score_accum
+        throws = self.current_round_throws
+        self.current_round_throws = []
+        self._round_score_accum = 0
+
         self.history.append({
             'round': self.round_count,
             'player_id': current_player.id,
             'player_name': current_player.name,
             'result': 'completed',
-            'throws': self.current_round_throws.copy(),
+            'throws': throws,
             'round_score': round_score
         })
 
-        self.current_round_throws.clear()
         next_player = self.next_player()
+        self._round_start_scores[self.current_player_index] = \
+            self._scores_list[self.current_player_index]
 
         # 全プレイヤーが1回投げ終わったらラウンドカウント増加
         if self.current_player_index == 0:
@@ -253,15 +290,35 @@ class ZeroOneGame(BaseGame):
             'game_state': self.get_state()
         }
 
-    def get_state(self) -> dict:
-        """ゲーム状態を取得"""
+    def get_state_light(self) -> dict:
+        """
+        履歴を除いた軽量なゲーム状態を取得
+
+        投擲ごとの配信用。historyはゲームが進むほど大きくなるため、
+        毎投のペイロードには含めない。返り値は読み取り専用として扱うこと。
+        """
         base_state = super().get_state()
         base_state.update({
             'starting_score': self.starting_score,
             'finish_type': self.finish_type,
             'scores': self.scores,
             'round_count': self.round_count,
-            'current_round_throws': self.current_round_throws,
-            'history': self.history
+            'current_round_throws': self.current_round_throws
         })
         return base_state
+
+    def get_full_history(self) -> List[dict]:
+        """保持している全履歴を取得（保持上限までの古い順リスト）"""
+        return list(self.history)
+
+    def get_state(self) -> dict:
+        """
+        ゲーム状態を取得（直近ラウンドの履歴込み、読み取り専用）
+
+        履歴は直近STATE_HISTORY_ROUNDSラウンドのみ含める。
+        それ以前も必要な場合はget_full_historyを使うこと。
+        """
+        state = self.get_state_light()
+        skip = max(0, len(self.history) - self.STATE_HISTORY_ROUNDS)
+        state['history'] = list(itertools.islice(self.history, skip, None))
+        return state
@@ -2,33 +2,80 @@
 
 import asyncio
 import logging
+import os
+import sys
+from pathlib import Path
 from typing import Callable, Optional
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
-from bleak.exc import BleakError
+from bleak.exc import BleakDeviceNotFoundError, BleakError
 
+from ..core.retry import retry_async
 from .constants import (
     DARTSLIVE_UART_UUID,
     CONNECTION_TIMEOUT,
     RECONNECT_RETRY_MAX,
     RECONNECT_DELAY,
+    RETRY_MAX_DELAY,
     DATA_PACKET_SIZE,
     SEGMENT_BYTE_INDEX
 )
 
 logger = logging.getLogger(__name__)
 
+# リトライしても回復見込みのないエラーメッセージの特徴
+# （デバイス不在・認証失敗はリトライで解決しない）
+_UNRECOVERABLE_MESSAGE_PARTS = (
+    'not found',
+    'authentication',
+    'org.bluez.error.failed',
+)
+
+
+class UnrecoverableBLEError(BleakError):
+    """リトライで回復見込みのないBLEエラー（デバイス不在・認証失敗など）"""
+
+
+def _is_unrecoverable(error: BleakError) -> bool:
+    """BleakErrorがリトライ不能かどうかを判定"""
+    if isinstance(error, BleakDeviceNotFoundError):
+        return True
+
+    message = str(error).lower()
+    return any(part in message for part in _UNRECOVERABLE_MESSAGE_PARTS)
+
 
 class DartsLiveClient:
     """DARTSLIVE HOMEデバイスとBLE通信を行うクライアント"""
 
+    # 属性アクセスを固定オフセット参照にする（通知ごとに触られるため）
+    __slots__ = (
+        'device',
+        'uart_uuid',
+        'connection_timeout',
+        'reconnect_retry_max',
+        'reconnect_delay',
+        'retry_max_delay',
+        'client',
+        '_is_connected',
+        '_data_callback',
+        '_disconnected_callback',
+        '_queue',
+        '_consumer_task',
+    )
+
+    # 未処理の通知を溜める上限（超過分は落として最新を優先する）
+    NOTIFICATION_QUEUE_SIZE = 256
+
     def __init__(
         self,
         device: BLEDevice,
         uart_uuid: str = DARTSLIVE_UART_UUID,
         connection_timeout: float = CONNECTION_TIMEOUT,
         reconnect_retry_max: int = RECONNECT_RETRY_MAX,
-        reconnect_delay: float = RECONNECT_DELAY
+        reconnect_delay: float = RECONNECT_DELAY,
+        retry_max_delay: float = RETRY_MAX_DELAY
     ):
         """
         Args:
@@ -36,50 +83,111 @@ class DartsLiveClient:
             uart_uuid: UART サービスのUUID
             connection_timeout: 接続タイムアウト(秒)
             reconnect_retry_max: 再接続最大リトライ回数
-            reconnect_delay: 再接続間隔(秒)
+            reconnect_delay: 再接続の基準間隔(秒、バックオフの初期値)
+            retry_max_delay: バックオフの上限(秒)
         """
         self.device = device
         self.uart_uuid = uart_uuid
         self.connection_timeout = connection_timeout
         self.reconnect_retry_max = reconnect_retry_max
         self.reconnect_delay = reconnect_delay
+        self.retry_max_delay = retry_max_delay
         self.client: Optional[BleakClient] = None
         self._is_connected = False
         self._data_callback: Optional[Callable[[int], None]] = None
+        self._disconnected_callback: Optional[Callable[[BleakClient], None]] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer_task: Optional[asyncio.Task] = None
 
     @property
     def is_connected(self) -> bool:
         """接続状態を取得"""
         return self._is_connected and self.client is not None and self.client.is_connected
 
-    def _notification_handler(self, sender: int, data: bytearray) -> None:
+    def _make_notification_handler(
+        self
+    ) -> Callable[[BleakGATTCharacteristic, bytearray], None]:
         """
-        BLE通知ハンドラー
+        通知ハンドラーのクロージャを生成
 
-        Args:
-            sender: 送信元の識別子
-            data: 受信データ
+        ホットパスで毎回行われるself._data_callback等の属性参照と
+        モジュール定数参照を、購読開始時点の1回だけに畳み込む。
+
+        Returns:
+            start_notifyに渡すハンドラー関数
         """
-        try:
-            logger.debug(f"通知ハンドラー開始: sender={sender}, data_len={len(data)}")
+        # 購読中はキュー投入のみ行い、重い処理は_consumeに逃がす。
+        # キュー未生成時（テスト・手動呼び出し）はコールバック直接呼び出し。
+        dispatch: Callable[[int], None]
+        if self._queue is not None:
+            dispatch = self._queue.put_nowait
+        else:
+            dispatch = self._dispatch_direct
+        packet_size = DATA_PACKET_SIZE
+        segment_index = SEGMENT_BYTE_INDEX
+        warning = logger.warning
+        debug = logger.debug
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        def handler(sender: BleakGATTCharacteristic, data: bytearray) -> None:
+            # データ形式: a1 03 XX 00 00 (XXがセグメント番号)
+            try:
+                if len(data) != packet_size:
+                    warning(
+                        "予期しないデータサイズ: %d bytes (期待値: %d bytes)",
+                        len(data), packet_size
+                    )
+                    return
+
+                segment_code = data[segment_index]
+                if debug_enabled:
+                    # data.hex()の文字列化はDEBUG有効時のみ行う
+                    debug("受信データ: %s -> セグメントコード: 0x%02x", data.hex(), segment_code)
+
+                dispatch(segment_code)
+
+            except asyncio.QueueFull:
+                warning("通知キューが満杯のためデータを破棄: 0x%02x", data[segment_index])
+            except Exception as e:
+                logger.error("通知ハンドラーでエラーが発生: %s", e, exc_info=True)
 
-            if len(data) != DATA_PACKET_SIZE:
-                logger.warning(
-                    f"予期しないデータサイズ: {len(data)} bytes (期待値: {DATA_PACKET_SIZE} bytes)"
-                )
-                return
+        return handler
 
-            # データ形式: a1 03 XX 00 00 (XXがセグメント番号)
-            segment_code = data[SEGMENT_BYTE_INDEX]
-            logger.debug(f"受信データ: {data.hex()} -> セグメントコード: 0x{segment_code:02x}")
+    def _dispatch_direct(self, segment_code: int) -> None:
+        """キューを介さずコールバックを直接呼び出す（互換経路用）"""
+        if self._data_callback:
+            self._data_callback(segment_code)
 
-            if self._data_callback:
-                logger.debug("コールバック関数を呼び出し中...")
-                self._data_callback(segment_code)
-                logger.debug("コールバック関数完了")
+    async def _consume(self) -> None:
+        """通知キューを消費してコールバックを呼び出すワーカー
 
-        except Exception as e:
-            logger.error(f"通知ハンドラーでエラーが発生: {e}", exc_info=True)
+        BLE通知ハンドラーはキュー投入だけで即座に返り、DB書き込み等の
+        重い処理はここでイベントループの別タスクとして実行される。
+        """
+        queue = self._queue
+        if queue is None:  # start_notify前に起動されることはないが念のため
+            return
+        while True:
+            segment_code = await queue.get()
+            try:
+                if self._data_callback:
+                    self._data_callback(segment_code)
+            except Exception as e:
+                logger.error("通知データの処理中にエラーが発生: %s", e, exc_info=True)
+
+    def _notification_handler(
+        self, sender: BleakGATTCharacteristic, data: bytearray
+    ) -> None:
+        """
+        BLE通知ハンドラー（テスト・手動呼び出し用の互換API）
+
+        実際の購読では_make_notification_handlerのクロージャを使う。
+
+        Args:
+            sender: 送信元の識別子
+            data: 受信データ
+        """
+        self._make_notification_handler()(sender, data)
 
     def set_data_callback(self, callback: Callable[[int], None]) -> None:
         """
@@ -90,6 +198,55 @@ class DartsLiveClient:
         """
         self._data_callback = callback
 
+    def set_disconnected_callback(self, callback: Callable[[BleakClient], None]) -> None:
+        """
+        切断時のコールバック関数を設定（connect前に呼ぶこと）
+
+        Args:
+            callback: 切断されたBleakClientを引数に取るコールバック関数
+        """
+        self._disconnected_callback = callback
+
+    async def _request_fast_conn_params(
+        self,
+        min_interval_us: int = 7500,
+        max_interval_us: int = 15000
+    ) -> None:
+        """
+        BLE接続間隔の短縮を要求（明示的なオプトイン時のみ）
+
+        既定の接続間隔（100ms超のことがある）だと通知1件ごとに
+        その分の遅延が乗るため、短い間隔を要求する。Linuxでは
+        debugfsのカーネル既定値を書き換える方式（新規接続に適用
+        されるため接続前に呼ぶこと）。
+
+        この書き換えはホスト全体のBLE接続に影響し、プロセス終了後も
+        残るため、環境変数BLE_CONN_TUNING=1を設定したときだけ行う。
+        未設定・権限がない・非対応プラットフォームの場合は何もしない。
+
+        Args:
+            min_interval_us: 最小接続間隔(マイクロ秒)
+            max_interval_us: 最大接続間隔(マイクロ秒)
+        """
+        if os.environ.get('BLE_CONN_TUNING') != '1':
+            return
+
+        if not sys.platform.startswith("linux"):
+            logger.debug("このプラットフォームでは接続間隔の変更をスキップ")
+            return
+
+        # debugfsの値は1.25ms単位
+        base = Path("/sys/kernel/debug/bluetooth/hci0")
+        try:
+            (base / "conn_min_interval").write_text(str(min_interval_us // 1250))
+            (base / "conn_max_interval").write_text(str(max_interval_us // 1250))
+            logger.info(
+                "BLE接続間隔を要求: %d-%dus", min_interval_us, max_interval_us
+            )
+        except OSError as e:
+            # root権限なし・debugfs未マウント等。既定の間隔で動作は継続できる
+            logger.debug("接続間隔の変更は適用されませんでした: %s", e)
+
     async def connect(self) -> bool:
         """
         デバイスに接続
@@ -98,36 +255,44 @@ class DartsLiveClient:
             接続成功時True、失敗時False
         """
         try:
-            logger.info(f"デバイスに接続中: {self.device.name} ({self.device.address})")
+            logger.info("デバイスに接続中: %s (%s)", self.device.name, self.device.address)
+            await self._request_fast_conn_params()
             self.client = BleakClient(
                 self.device.address,
-                timeout=self.connection_timeout
+                timeout=self.connection_timeout,
+                disconnected_callback=self._disconnected_callback
             )
             await self.client.connect()
 
             if self.client.is_connected:
-                logger.info(f"接続成功: {self.device.name}")
+                logger.info("接続成功: %s", self.device.name)
                 self._is_connected = True
                 return True
             else:
                 logger.error("接続に失敗しました")
                 return False
 
+        except UnrecoverableBLEError:
+            raise
         except BleakError as e:
-            logger.error(f"BLE接続エラー: {e}")
+            if _is_unrecoverable(e):
+                # リトライで解決しないエラーは呼び出し側で即座に打ち切る
+                raise UnrecoverableBLEError(str(e)) from e
+            logger.error("BLE接続エラー: %s", e)
             return False
         except Exception as e:
-            logger.error(f"接続中に予期しないエラー: {e}")
+            logger.error("接続中に予期しないエラー: %s", e)
             return False
 
     async def disconnect(self) -> None:
         """デバイスから切断"""
-        if self.client and self.client.is_connected:
+        client = self.client
+        if client and client.is_connected:
             try:
-                await self.client.disconnect()
+                await client.disconnect()
                 logger.info("デバイスから切断しました")
             except Exception as e:
-                logger.error(f"切断中にエラーが発生: {e}")
+                logger.error("切断中にエラーが発生: %s", e)
             finally:
                 self._is_connected = False
 
@@ -143,46 +308,71 @@ class DartsLiveClient:
             return False
 
         try:
-            logger.info(f"UUID {self.uart_uuid} の通知受信を開始")
-            await self.client.start_notify(self.uart_uuid, self._notification_handler)
+            logger.info("UUID %s の通知受信を開始", self.uart_uuid)
+            self._queue = asyncio.Queue(maxsize=self.NOTIFICATION_QUEUE_SIZE)
+            self._consumer_task = asyncio.create_task(self._consume())
+            await self.client.start_notify(self.uart_uuid, self._make_notification_handler())
             logger.info("通知受信を開始しました")
             return True
 
         except BleakError as e:
-            logger.error(f"通知開始エラー: {e}")
+            logger.error("通知開始エラー: %s", e)
+            self._cancel_consumer()
             return False
         except Exception as e:
-            logger.error(f"通知開始中に予期しないエラー: {e}")
+            logger.error("通知開始中に予期しないエラー: %s", e)
+            self._cancel_consumer()
             return False
 
+    def _cancel_consumer(self) -> None:
+        """消費タスクとキューを破棄する（通知開始失敗時の後始末）"""
+        task = self._consumer_task
+        if task is not None:
+            task.cancel()
+            self._consumer_task = None
+        self._queue = None
+
     async def stop_notify(self) -> None:
         """通知の受信を停止"""
-        if self.is_connected and self.client:
+        client = self.client
+        if self.is_connected and client:
             try:
-                await self.client.stop_notify(self.uart_uuid)
+                await client.stop_notify(self.uart_uuid)
                 logger.info("通知受信を停止しました")
             except Exception as e:
-                logger.error(f"通知停止中にエラーが発生: {e}")
+                logger.error("通知停止中にエラーが発生: %s", e)
+
+        task = self._consumer_task
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            self._consumer_task = None
+        self._queue = None
 
     async def connect_with_retry(self) -> bool:
         """
-        リトライ付きで接続
+        リトライ付きで接続（指数バックオフ + ジッター付き）
 
         Returns:
             接続成功時True、失敗時False
         """
-        for attempt in range(1, self.reconnect_retry_max + 1):
-            logger.info(f"接続試行 {attempt}/{self.reconnect_retry_max}")
-
-            if await self.connect():
-                return True
-
-            if attempt < self.reconnect_retry_max:
-                logger.info(f"{self.reconnect_delay}秒後に再接続します...")
-                await asyncio.sleep(self.reconnect_delay)
+        try:
+            result = await retry_async(
+                self.connect,
+                max_attempts=self.reconnect_retry_max,
+                base_delay=self.reconnect_delay,
+                max_delay=self.retry_max_delay,
+                description="接続"
+            )
+        except UnrecoverableBLEError as e:
+            # 回復見込みがないため待機せず即座に失敗を返す
+            logger.error("回復不能なBLEエラーのため接続を中止: %s", e)
+            return False
 
-        logger.error(f"{self.reconnect_retry_max}回の接続試行に失敗しました")
-        return False
+        return bool(result)
 
     async def __aenter__(self):
         """非同期コンテキストマネージャーのエントリー"""
@@ -14,7 +14,11 @@ SCAN_RETRY_DELAY = 5.0  # リトライ間隔(秒)
 # 接続設定
 CONNECTION_TIMEOUT = 15.0  # 接続タイムアウト(秒)
 RECONNECT_RETRY_MAX = 3    # 再接続最大リトライ回数
-RECONNECT_DELAY = 3.0      # 再接続間隔(秒)
+RECONNECT_DELAY = 3.0      # 再接続の基準間隔(秒、バックオフの初期値)
+
+# リトライのバックオフ上限(秒)。間隔は基準値から指数的に広がり、
+# この値で頭打ちになる（実際の待機にはジッターがかかる）
+RETRY_MAX_DELAY = 30.0
 
 # データフォーマット
 DATA_PACKET_SIZE = 5  # 受信データのサイズ(バイト)
@@ -6,11 +6,13 @@ from typing import Optional, List
 from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
 
+from ..core.retry import retry_async
 from .constants import (
     DARTSLIVE_DEVICE_NAME_PATTERNS,
     SCAN_TIMEOUT,
     SCAN_RETRY_MAX,
-    SCAN_RETRY_DELAY
+    SCAN_RETRY_DELAY,
+    RETRY_MAX_DELAY
 )
 
 logger = logging.getLogger(__name__)
@@ -24,19 +26,24 @@ class DartsLiveScanner:
         device_name_patterns: Optional[List[str]] = None,
         scan_timeout: float = SCAN_TIMEOUT,
         retry_max: int = SCAN_RETRY_MAX,
-        retry_delay: float = SCAN_RETRY_DELAY
+        retry_delay: float = SCAN_RETRY_DELAY,
+        retry_max_delay: float = RETRY_MAX_DELAY
     ):
         """
         Args:
             device_name_patterns: デバイス名のパターンリスト
             scan_timeout: スキャンタイムアウト(秒)
             retry_max: 最大リトライ回数
-            retry_delay: リトライ間隔(秒)
+            retry_delay: リトライの基準間隔(秒、バックオフの初期値)
+            retry_max_delay: バックオフの上限(秒)
         """
         self.device_name_patterns = device_name_patterns or DARTSLIVE_DEVICE_NAME_PATTERNS
+        # 判定はデバイス検出ごとに走るため、パターンの小文字化は1回だけ行う
+        self._lower_patterns = tuple(p.lower() for p in self.device_name_patterns)
         self.scan_timeout = scan_timeout
         self.retry_max = retry_max
         self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
 
     def _is_dartslive_device(self, device: BLEDevice) -> bool:
         """
@@ -48,60 +55,70 @@ class DartsLiveScanner:
         Returns:
             DARTSLIVE HOMEの場合True
         """
-        if not device.name:
+        name = device.name
+        if not name:
             return False
 
-        return any(
-            pattern.lower() in device.name.lower()
-            for pattern in self.device_name_patterns
-        )
+        name = name.lower()
+        return any(pattern in name for pattern in self._lower_patterns)
 
     async def scan_once(self) -> Optional[BLEDevice]:
         """
         1回のスキャンを実行してDARTSLIVE HOMEデバイスを探す
 
+        検出コールバックで対象デバイスのアドバタイズを受け取った時点で
+        即座に終了する（タイムアウトまで待ち切らない）。
+
         Returns:
             見つかったデバイス、見つからなければNone
         """
-        logger.info(f"BLEデバイスをスキャン中... (タイムアウト: {self.scan_timeout}秒)")
+        logger.info("BLEデバイスをスキャン中... (タイムアウト: %s秒)", self.scan_timeout)
 
-        try:
-            devices = await BleakScanner.discover(timeout=self.scan_timeout)
-            logger.info(f"{len(devices)}個のBLEデバイスが見つかりました")
+        found = asyncio.Event()
+        result: List[BLEDevice] = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        def on_detection(device: BLEDevice, _advertisement_data) -> None:
+            if debug_enabled:
+                logger.debug("検出: %s (%s)", device.name, device.address)
+            if not result and self._is_dartslive_device(device):
+                result.append(device)
+                found.set()
 
-            for device in devices:
-                logger.debug(f"検出: {device.name} ({device.address})")
-                if self._is_dartslive_device(device):
-                    logger.info(f"DARTSLIVE HOMEデバイスを発見: {device.name} ({device.address})")
-                    return device
+        try:
+            async with BleakScanner(detection_callback=on_detection):
+                try:
+                    await asyncio.wait_for(found.wait(), timeout=self.scan_timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+            if result:
+                device = result[0]
+                logger.info("DARTSLIVE HOMEデバイスを発見: %s (%s)", device.name, device.address)
+                return device
 
             logger.warning("DARTSLIVE HOMEデバイスが見つかりませんでした")
             return None
 
         except Exception as e:
-            logger.error(f"スキャン中にエラーが発生: {e}")
+            logger.error("スキャン中にエラーが発生: %s", e)
             return None
 
     async def scan_with_retry(self) -> Optional[BLEDevice]:
         """
         リトライ付きでDARTSLIVE HOMEデバイスをスキャン
+        （指数バックオフ + ジッター付き）
 
         Returns:
             見つかったデバイス、見つからなければNone
         """
-        for attempt in range(1, self.retry_max + 1):
-            logger.info(f"スキャン試行 {attempt}/{self.retry_max}")
-
-            device = await self.scan_once()
-            if device:
-                return device
-
-            if attempt < self.retry_max:
-                logger.info(f"{self.retry_delay}秒後に再スキャンします...")
-                await asyncio.sleep(self.retry_delay)
-
-        logger.error(f"{self.retry_max}回のスキャンでデバイスが見つかりませんでした")
-        return None
+        return await retry_async(
+            self.scan_once,
+            max_attempts=self.retry_max,
+            base_delay=self.retry_delay,
+            max_delay=self.retry_max_delay,
+            description="スキャン"
+        )
 
     async def scan_all_devices(self) -> List[BLEDevice]:
         """
@@ -119,12 +136,12 @@ class DartsLiveScanner:
                 if self._is_dartslive_device(device)
             ]
 
-            logger.info(f"{len(dartslive_devices)}個のDARTSLIVE HOMEデバイスが見つかりました")
+            logger.info("%d個のDARTSLIVE HOMEデバイスが見つかりました", len(dartslive_devices))
             for device in dartslive_devices:
-                logger.info(f"  - {device.name} ({device.address})")
+                logger.info("  - %s (%s)", device.name, device.address)
 
             return dartslive_devices
 
         except Exception as e:
-            logger.error(f"スキャン中にエラーが発生: {e}")
+            logger.error("スキャン中にエラーが発生: %s", e)
             return []
@@ -1,11 +1,13 @@
 """設定管理"""
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+# slots=Trueで属性アクセスを高速化しインスタンスを軽量化、
+# frozen=Trueでハッシュ可能にし派生値のキャッシュを可能にする
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """アプリケーション設定"""
 
@@ -19,6 +21,7 @@ class AppConfig:
     connection_timeout: float = 15.0
     reconnect_retry_max: int = 3
     reconnect_delay: float = 3.0
+    retry_max_delay: float = 30.0  # リトライバックオフの上限(秒)
 
     # ログ設定
     log_level: str = "INFO"
@@ -44,15 +47,5 @@ class AppConfig:
 
     def to_dict(self) -> dict:
         """辞書形式に変換"""
-        return {
-            'db_path': self.db_path,
-            'scan_timeout': self.scan_timeout,
-            'scan_retry_max': self.scan_retry_max,
-            'scan_retry_delay': self.scan_retry_delay,
-            'connection_timeout': self.connection_timeout,
-            'reconnect_retry_max': self.reconnect_retry_max,
-            'reconnect_delay': self.reconnect_delay,
-            'log_level': self.log_level,
-            'log_format': self.log_format,
-            'data_retention_days': self.data_retention_days,
-        }
+        # フィールド追加時の列挙漏れを防ぐためasdictに委ねる
+        return asdict(self)
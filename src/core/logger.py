@@ -4,6 +4,9 @@ import logging
 import sys
 from typing import Optional
 
+# レベル名 -> 数値の解決表（getattrによる動的属性参照を避ける）
+_LEVELS = logging.getLevelNamesMapping()
+
 
 def setup_logger(
     log_level: str = "INFO",
@@ -20,13 +23,15 @@ def setup_logger(
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     # ルートロガーの設定
+    # force=Trueにより2回目以降の呼び出しでも黙って無視されず再設定される
     logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
+        level=_LEVELS.get(log_level.upper(), logging.INFO),
         format=log_format,
         datefmt="%Y-%m-%d %H:%M:%S",
         handlers=[
             logging.StreamHandler(sys.stdout)
-        ]
+        ],
+        force=True
     )
 
     # 外部ライブラリのログレベルを調整
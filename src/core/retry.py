@@ -0,0 +1,69 @@
+"""リトライ制御ユーティリティ (指数バックオフ + フルジッター)"""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    切り詰め指数バックオフ + フルジッターの待機秒数を計算
+
+    固定間隔のリトライはBLEスタックの輻輳時に各クライアントが同じ
+    タイミングで再試行してしまうため、間隔を指数的に広げつつ
+    0〜上限の一様乱数でばらつかせる。
+
+    Args:
+        attempt: 試行回数（1始まり）
+        base_delay: 初回の基準待機秒数
+        max_delay: 待機秒数の上限
+
+    Returns:
+        待機秒数
+    """
+    capped = min(max_delay, base_delay * (2 ** (attempt - 1)))
+    return random.uniform(0, capped)
+
+
+async def retry_async(
+    operation: Callable[[], Awaitable[Optional[T]]],
+    max_attempts: int,
+    base_delay: float,
+    max_delay: float,
+    description: str = "処理"
+) -> Optional[T]:
+    """
+    非同期処理をバックオフ付きでリトライ
+
+    operationの戻り値が真になった時点でその値を返す。
+    スキャンと接続で同一のリトライ挙動を共有するための共通ヘルパー。
+
+    Args:
+        operation: 引数なしで呼べる非同期処理
+        max_attempts: 最大試行回数
+        base_delay: 初回の基準待機秒数
+        max_delay: 待機秒数の上限
+        description: ログに出す処理名
+
+    Returns:
+        成功時はoperationの戻り値、全試行失敗時はNone
+    """
+    for attempt in range(1, max_attempts + 1):
+        logger.info("%s試行 %d/%d", description, attempt, max_attempts)
+
+        result = await operation()
+        if result:
+            return result
+
+        if attempt < max_attempts:
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            logger.info("%.1f秒後に再試行します...", delay)
+            await asyncio.sleep(delay)
+
+    logger.error("%d回の試行に失敗しました: %s", max_attempts, description)
+    return None
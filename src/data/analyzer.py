@@ -1,15 +1,17 @@
 """データ分析機能"""
 
+import itertools
 import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import Counter
 
-from .models import DartThrow
 from .storage import DartDatabase
 
 logger = logging.getLogger(__name__)
 
+# レポートの罫線（呼び出しごとに作り直さない）
+_REPORT_RULE = "=" * 50
+
 
 class DartAnalyzer:
     """ダーツデータの分析クラス"""
@@ -38,31 +40,13 @@ class DartAnalyzer:
         Returns:
             統計情報の辞書
         """
-        throws = self.db.get_throws(
+        # 集計はSQL側で行い、行オブジェクトの生成を避ける
+        return self.db.get_statistics_summary(
             device_address=device_address,
             start_time=start_time,
             end_time=end_time
         )
 
-        if not throws:
-            return {
-                'total_throws': 0,
-                'total_score': 0,
-                'average_score': 0.0,
-                'max_score': 0,
-                'min_score': 0,
-            }
-
-        scores = [t.score for t in throws if t.score is not None]
-
-        return {
-            'total_throws': len(throws),
-            'total_score': sum(scores),
-            'average_score': sum(scores) / len(scores) if scores else 0.0,
-            'max_score': max(scores) if scores else 0,
-            'min_score': min(scores) if scores else 0,
-        }
-
     def get_segment_distribution(
         self,
         device_address: Optional[str] = None,
@@ -82,15 +66,14 @@ class DartAnalyzer:
         Returns:
             (セグメント名, 投擲回数) のリスト
         """
-        throws = self.db.get_throws(
+        # 集計はSQL側 (GROUP BY) で行い、行オブジェクトの生成を避ける
+        return self.db.get_segment_distribution(
             device_address=device_address,
             start_time=start_time,
-            end_time=end_time
+            end_time=end_time,
+            top_n=top_n
         )
 
-        segment_counter = Counter(t.segment_name for t in throws)
-        return segment_counter.most_common(top_n)
-
     def get_score_distribution(
         self,
         device_address: Optional[str] = None,
@@ -108,15 +91,13 @@ class DartAnalyzer:
         Returns:
             {得点: 回数} の辞書
         """
-        throws = self.db.get_throws(
+        # 集計はSQL側 (GROUP BY) で行い、行オブジェクトの生成を避ける
+        return self.db.get_score_distribution(
             device_address=device_address,
             start_time=start_time,
             end_time=end_time
         )
 
-        score_counter = Counter(t.score for t in throws if t.score is not None)
-        return dict(sorted(score_counter.items()))
-
     def get_accuracy_by_target(
         self,
         target_number: int,
@@ -136,36 +117,25 @@ class DartAnalyzer:
         Returns:
             精度情報の辞書
         """
-        throws = self.db.get_throws(
+        # 命中数・倍率別の内訳は条件付きSUMで1クエリに集約
+        summary = self.db.get_accuracy_summary(
+            target_number,
             device_address=device_address,
             start_time=start_time,
             end_time=end_time
         )
 
-        target_throws = [t for t in throws if t.base_number == target_number]
-        total_throws = len(throws)
-
-        if total_throws == 0:
-            return {
-                'target_number': target_number,
-                'hit_count': 0,
-                'total_throws': 0,
-                'accuracy': 0.0,
-                'single_count': 0,
-                'double_count': 0,
-                'triple_count': 0,
-            }
-
-        multiplier_counter = Counter(t.multiplier for t in target_throws)
+        total_throws = summary['total_throws']
+        hit_count = summary['hit_count']
 
         return {
             'target_number': target_number,
-            'hit_count': len(target_throws),
+            'hit_count': hit_count,
             'total_throws': total_throws,
-            'accuracy': len(target_throws) / total_throws * 100,
-            'single_count': multiplier_counter.get(1, 0),
-            'double_count': multiplier_counter.get(2, 0),
-            'triple_count': multiplier_counter.get(3, 0),
+            'accuracy': hit_count / total_throws * 100 if total_throws else 0.0,
+            'single_count': summary['single_count'],
+            'double_count': summary['double_count'],
+            'triple_count': summary['triple_count'],
         }
 
     def get_daily_summary(
@@ -223,15 +193,23 @@ class DartAnalyzer:
         Returns:
             投擲データのリスト
         """
-        throws = self.db.get_throws(limit=limit, device_address=device_address)
+        # 表示に使う3カラムだけ列指向で取得し、行ごとのDartThrow生成を省く
+        cols = self.db.get_throws_columns(
+            ('timestamp', 'segment_name', 'score'),
+            limit=limit,
+            device_address=device_address
+        )
 
         return [
             {
-                'timestamp': t.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                'segment': t.segment_name,
-                'score': t.score,
+                # strftimeの書式解析を避ける（出力形式は同一）
+                'timestamp': datetime.fromtimestamp(ts_us / 1e6).isoformat(
+                    sep=' ', timespec='seconds'),
+                'segment': segment,
+                'score': score,
             }
-            for t in throws
+            for ts_us, segment, score in zip(
+                cols['timestamp'], cols['segment_name'], cols['score'])
         ]
 
     def export_report(
@@ -254,10 +232,10 @@ class DartAnalyzer:
         stats = self.get_statistics(device_address, start_time, end_time)
         top_segments = self.get_segment_distribution(device_address, start_time, end_time, top_n=10)
 
-        report_lines = [
-            "=" * 50,
+        header_lines = (
+            _REPORT_RULE,
             "DARTSLIVE HOME データレポート",
-            "=" * 50,
+            _REPORT_RULE,
             "",
             "【基本統計】",
             f"  総投擲数: {stats['total_throws']}回",
@@ -267,12 +245,13 @@ class DartAnalyzer:
             f"  最低得点: {stats['min_score']}点",
             "",
             "【よく狙ったセグメント (Top 10)】",
-        ]
-
-        for i, (segment, count) in enumerate(top_segments, 1):
-            report_lines.append(f"  {i:2d}. {segment}: {count}回")
-
-        report_lines.append("")
-        report_lines.append("=" * 50)
+        )
 
-        return "\n".join(report_lines)
+        return "\n".join(itertools.chain(
+            header_lines,
+            (
+                "  %2d. %s: %d回" % (i, segment, count)
+                for i, (segment, count) in enumerate(top_segments, 1)
+            ),
+            ("", _REPORT_RULE),
+        ))
@@ -1,11 +1,62 @@
 """セグメントコードのマッピング機能"""
 
 import logging
-from typing import Optional, Tuple
+import sys
+from array import array
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def _build_default_mapping() -> dict:
+    """
+    デフォルトのマッピングテーブルを作成
+
+    注: このマッピングは実機（DARTSLIVE HOME）でテストして確認済みです。
+
+    Returns:
+        セグメントコード -> (基本数字, 倍率, セグメント名) の辞書
+    """
+    mapping = {}
+
+    # セグメント名はintern済み文字列を全DartThrowで共有させる
+    # （辞書キー比較がポインタ一致の早道に乗り、ヒープも節約できる）
+    intern = sys.intern
+
+    # シングル（内側）1-20 - 0x01から0x14 (実機確認済み)
+    for num in range(1, 21):
+        code = 0x00 + num
+        mapping[code] = (num, 1, intern(f"シングル{num}(内)"))
+
+    # シングル（外側）1-20 - 0x15から0x28 (実機確認済み)
+    for num in range(1, 21):
+        code = 0x14 + num
+        mapping[code] = (num, 1, intern(f"シングル{num}(外)"))
+
+    # ダブル1-20 - 0x29から0x3c (実機確認済み)
+    for num in range(1, 21):
+        code = 0x28 + num
+        mapping[code] = (num, 2, intern(f"ダブル{num}"))
+
+    # トリプル1-20 - 0x3dから0x50 (実機確認済み)
+    for num in range(1, 21):
+        code = 0x3c + num
+        mapping[code] = (num, 3, intern(f"トリプル{num}"))
+
+    # ブル (実機確認済み)
+    mapping[0x51] = (25, 1, intern("アウターブル"))
+    mapping[0x52] = (25, 2, intern("インナーブル"))
+
+    # プレイヤー交代ボタン (特殊なボタン - 将来のWebアプリで利用予定)
+    mapping[0x54] = (0, 0, intern("プレイヤー交代"))
+
+    return mapping
+
+
+# モジュール読み込み時に1回だけ構築し、インスタンス生成時は浅いコピーで済ます
+_DEFAULT_MAPPING = _build_default_mapping()
+
+
 class SegmentMapper:
     """セグメントコードをダーツボードのセグメント情報にマッピング"""
 
@@ -18,47 +69,62 @@ class SegmentMapper:
         """
         # セグメントコード -> (基本数字, 倍率) のマッピング
         # 倍率: 1=シングル, 2=ダブル, 3=トリプル, 25=ブル(シングル), 50=ブル(ダブル/ブルズアイ)
-        self._mapping = self._create_default_mapping()
-
-    def _create_default_mapping(self) -> dict:
+        # キャリブレーションで書き換えられるため共有せずコピーを持つ
+        self._mapping = dict(_DEFAULT_MAPPING)
+        self._rebuild_score_table()
+
+    def _rebuild_score_table(self) -> None:
+        """得点テーブルを事前計算（通知1件ごとの乗算とタプル展開を省く）"""
+        # マッピングが変わったのでエクスポート結果のキャッシュも無効化
+        self._export_cache: Optional[dict] = None
+        self._score_table = {
+            code: base_number * multiplier
+            for code, (base_number, multiplier, _) in self._mapping.items()
+            if base_number is not None and multiplier is not None
+        }
+        self._rebuild_lookup_table()
+
+    def _rebuild_lookup_table(self) -> None:
+        """コード直引きの参照テーブルを事前構築（256要素、未定義はNone）"""
+        table = [None] * 256
+        info_table = [None] * 256
+        for code, info in self._mapping.items():
+            if 0 <= code < 256:
+                base_number, multiplier, segment_name = info
+                info_table[code] = info
+                table[code] = (
+                    base_number,
+                    multiplier,
+                    segment_name,
+                    self._score_table.get(code)
+                )
+        self._lookup_table = tuple(table)
+        self._info_table = tuple(info_table)
+        # 一括採点用のC連続配列（未定義コードは-1）
+        self._score_array = array('h', (
+            entry[3] if entry is not None and entry[3] is not None else -1
+            for entry in self._lookup_table
+        ))
+
+    def lookup(
+        self, segment_code: int
+    ) -> Optional[Tuple[Optional[int], Optional[int], str, Optional[int]]]:
         """
-        デフォルトのマッピングテーブルを作成
+        セグメント情報と得点を1回の参照でまとめて取得
 
-        注: このマッピングは実機（DARTSLIVE HOME）でテストして確認済みです。
+        get_segment_info + get_scoreの2回呼び出しを1回の添字アクセスに
+        まとめたホットパス用API。
+
+        Args:
+            segment_code: セグメントコード
 
         Returns:
-            セグメントコード -> (基本数字, 倍率, セグメント名) の辞書
+            (基本数字, 倍率, セグメント名, 得点) のタプル
+            マッピングが見つからない場合はNone
         """
-        mapping = {}
-
-        # シングル（内側）1-20 - 0x01から0x14 (実機確認済み)
-        for num in range(1, 21):
-            code = 0x00 + num
-            mapping[code] = (num, 1, f"シングル{num}(内)")
-
-        # シングル（外側）1-20 - 0x15から0x28 (実機確認済み)
-        for num in range(1, 21):
-            code = 0x14 + num
-            mapping[code] = (num, 1, f"シングル{num}(外)")
-
-        # ダブル1-20 - 0x29から0x3c (実機確認済み)
-        for num in range(1, 21):
-            code = 0x28 + num
-            mapping[code] = (num, 2, f"ダブル{num}")
-
-        # トリプル1-20 - 0x3dから0x50 (実機確認済み)
-        for num in range(1, 21):
-            code = 0x3c + num
-            mapping[code] = (num, 3, f"トリプル{num}")
-
-        # ブル (実機確認済み)
-        mapping[0x51] = (25, 1, "アウターブル")
-        mapping[0x52] = (25, 2, "インナーブル")
-
-        # プレイヤー交代ボタン (特殊なボタン - 将来のWebアプリで利用予定)
-        mapping[0x54] = (0, 0, "プレイヤー交代")
-
-        return mapping
+        if 0 <= segment_code < 256:
+            return self._lookup_table[segment_code]
+        return None
 
     def get_segment_info(self, segment_code: int) -> Tuple[Optional[int], Optional[int], str]:
         """
@@ -71,11 +137,15 @@ class SegmentMapper:
             (基本数字, 倍率, セグメント名) のタプル
             マッピングが見つからない場合は (None, None, "不明")
         """
-        if segment_code in self._mapping:
-            return self._mapping[segment_code]
-        else:
-            logger.warning(f"未知のセグメントコード: 0x{segment_code:02x}")
-            return (None, None, f"不明(0x{segment_code:02x})")
+        # 辞書のハッシュ参照ではなくコード直引きのテーブルを使う
+        # （_mappingはエクスポート/インポート用の正とする表として残す）
+        if 0 <= segment_code < 256:
+            info = self._info_table[segment_code]
+            if info is not None:
+                return info
+
+        logger.warning("未知のセグメントコード: 0x%02x", segment_code)
+        return (None, None, f"不明(0x{segment_code:02x})")
 
     def get_score(self, segment_code: int) -> Optional[int]:
         """
@@ -87,12 +157,27 @@ class SegmentMapper:
         Returns:
             得点、計算できない場合はNone
         """
-        base_number, multiplier, _ = self.get_segment_info(segment_code)
+        if 0 <= segment_code < 256:
+            entry = self._lookup_table[segment_code]
+            if entry is not None:
+                return entry[3]
+        return None
 
-        if base_number is None or multiplier is None:
-            return None
+    def score_many(self, codes: bytes) -> List[int]:
+        """
+        セグメントコード列をまとめて採点（ログの再処理・リプレイ用）
+
+        bytesの反復は直接intを返すため、コードごとのメソッド呼び出しを
+        挟まずC連続配列への添字アクセスだけで採点できる。
 
-        return base_number * multiplier
+        Args:
+            codes: セグメントコードのバイト列
+
+        Returns:
+            得点のリスト（未定義コードは-1）
+        """
+        score_array = self._score_array
+        return [score_array[code] for code in codes]
 
     def update_mapping(self, segment_code: int, base_number: int,
                       multiplier: int, segment_name: str) -> None:
@@ -105,17 +190,26 @@ class SegmentMapper:
             multiplier: 倍率
             segment_name: セグメント名
         """
-        self._mapping[segment_code] = (base_number, multiplier, segment_name)
-        logger.info(f"マッピングを更新: 0x{segment_code:02x} -> {segment_name}")
+        self._mapping[segment_code] = (base_number, multiplier, sys.intern(segment_name))
+        self._rebuild_score_table()
+        logger.info("マッピングを更新: 0x%02x -> %s", segment_code, segment_name)
 
     def export_mapping(self) -> dict:
         """
         マッピングテーブルをエクスポート
 
+        16進キーの整形とネスト辞書の構築はマッピング変更後の初回だけ
+        行い、以降は同じ辞書を返す（APIレスポンス等で繰り返し呼ばれる
+        前提。受け取り側は読み取り専用として扱うこと）。
+
         Returns:
             マッピングテーブルの辞書
         """
-        return {
+        cached = self._export_cache
+        if cached is not None:
+            return cached
+
+        result = {
             f"0x{code:02x}": {
                 'base_number': base_number,
                 'multiplier': multiplier,
@@ -123,6 +217,8 @@ class SegmentMapper:
             }
             for code, (base_number, multiplier, segment_name) in self._mapping.items()
         }
+        self._export_cache = result
+        return result
 
     def import_mapping(self, mapping_dict: dict) -> None:
         """
@@ -131,11 +227,16 @@ class SegmentMapper:
         Args:
             mapping_dict: インポートするマッピング辞書
         """
-        for code_str, info in mapping_dict.items():
-            code = int(code_str, 16) if code_str.startswith('0x') else int(code_str)
-            self._mapping[code] = (
+        # 全件を新しい辞書として構築してから差し替える
+        # （途中の解析エラーで中途半端に更新された状態を残さない）
+        new_mapping = {
+            int(code_str, 16) if code_str.startswith('0x') else int(code_str): (
                 info['base_number'],
                 info['multiplier'],
-                info['segment_name']
+                sys.intern(info['segment_name'])
             )
-        logger.info(f"{len(mapping_dict)}個のマッピングをインポートしました")
+            for code_str, info in mapping_dict.items()
+        }
+        self._mapping.update(new_mapping)
+        self._rebuild_score_table()
+        logger.info("%d個のマッピングをインポートしました", len(mapping_dict))
@@ -1,16 +1,35 @@
 """データモデル定義"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """ISO形式文字列のパース結果をキャッシュする
+
+    リプレイやインポートでは同じタイムスタンプ文字列が繰り返し
+    現れるため、fromisoformatの再パースを省く。
+    """
+    return datetime.fromisoformat(value)
+
+
+# slots=True: BLEパケットごと・クエリ行ごとに生成されるため、
+# __dict__を持たせず省メモリ・高速な属性アクセスにする
+@dataclass(slots=True)
 class DartThrow:
     """ダーツの投擲データ"""
 
+    # 公開フィールド（宣言順）。from_dictのキーのフィルタに使う
+    _FIELDS = (
+        'id', 'timestamp', 'segment_code', 'segment_name',
+        'base_number', 'multiplier', 'score', 'device_address', 'device_name',
+    )
+
     id: Optional[int] = None  # データベースID
-    timestamp: Optional[datetime] = None  # 投擲時刻
+    timestamp: datetime = field(default_factory=datetime.now)  # 投擲時刻
     segment_code: int = 0  # セグメントコード (生データ)
     segment_name: str = ""  # セグメント名 (例: "ダブル20", "トリプル1")
     base_number: Optional[int] = None  # 基本数字 (1-20, 25)
@@ -19,16 +38,40 @@ class DartThrow:
     device_address: str = ""  # デバイスのMACアドレス
     device_name: str = ""  # デバイス名
 
-    def __post_init__(self):
-        """初期化後の処理"""
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    # to_dict結果のキャッシュ（保存後は同じ辞書がイベント配信とAPIで使い回される）
+    # init=False: __init__やdataclasses.replace()の引数にならず、
+    # 複製時に古いキャッシュを持ち越さない
+    _dict_cache: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False)
+    # timestamp.isoformat()のキャッシュ（保存とto_dictで二重に整形しない）
+    _iso_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    @property
+    def iso_timestamp(self) -> str:
+        """投擲時刻のISO形式文字列（初回アクセス時に整形して再利用）"""
+        iso = self._iso_cache
+        if iso is None:
+            iso = self.timestamp.isoformat()
+            self._iso_cache = iso
+        return iso
 
     def to_dict(self) -> dict:
-        """辞書形式に変換"""
-        return {
+        """
+        辞書形式に変換（同一インスタンスでは結果を再利用）
+
+        保存後のID確定はキャッシュ済み辞書への書き込み1回で反映され、
+        再構築は行わない。イベント配信にもこの辞書がそのまま使われるため、
+        受け取り側は読み取り専用のスナップショットとして扱うこと。
+        """
+        cached = self._dict_cache
+        if cached is not None:
+            cached['id'] = self.id
+            return cached
+
+        result = {
             'id': self.id,
-            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+            'timestamp': self.iso_timestamp,
             'segment_code': self.segment_code,
             'segment_name': self.segment_name,
             'base_number': self.base_number,
@@ -37,36 +80,39 @@ class DartThrow:
             'device_address': self.device_address,
             'device_name': self.device_name,
         }
+        self._dict_cache = result
+        return result
 
     @classmethod
     def from_dict(cls, data: dict) -> 'DartThrow':
-        """辞書からインスタンスを生成"""
-        if 'timestamp' in data and isinstance(data['timestamp'], str):
-            data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-        return cls(**data)
+        """辞書からインスタンスを生成
 
+        _FIELDSにあるキーだけを拾うため、余分なキーが混ざっていても
+        無視される。入力の辞書は書き換えない。
+        """
+        kwargs = {key: data[key] for key in cls._FIELDS if key in data}
+        timestamp = kwargs.get('timestamp')
+        if isinstance(timestamp, str):
+            kwargs['timestamp'] = _parse_timestamp(timestamp)
+        return cls(**kwargs)
 
-@dataclass
+
+@dataclass(slots=True)
 class GameSession:
     """ゲームセッション (将来の機能拡張用)"""
 
     id: Optional[int] = None
-    start_time: Optional[datetime] = None
+    start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
     device_address: str = ""
     throw_count: int = 0
     total_score: int = 0
 
-    def __post_init__(self):
-        """初期化後の処理"""
-        if self.start_time is None:
-            self.start_time = datetime.now()
-
     def to_dict(self) -> dict:
         """辞書形式に変換"""
         return {
             'id': self.id,
-            'start_time': self.start_time.isoformat() if self.start_time else None,
+            'start_time': self.start_time.isoformat(),
             'end_time': self.end_time.isoformat() if self.end_time else None,
             'device_address': self.device_address,
             'throw_count': self.throw_count,
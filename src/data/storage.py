@@ -1,34 +1,180 @@
 """データストレージ機能 (SQLite)"""
 
+import itertools
 import sqlite3
 import logging
+import threading
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from contextlib import contextmanager
 
 from .models import DartThrow, GameSession
 
 logger = logging.getLogger(__name__)
 
+# dart_throwsのインデックス定義（初期化と一括インポート後の再構築で共用）
+_THROW_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_timestamp ON dart_throws(timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_device ON dart_throws(device_address)",
+    # 集計クエリ（GROUP BY segment_name等）用の複合インデックス
+    "CREATE INDEX IF NOT EXISTS idx_device_time_segment"
+    " ON dart_throws(device_address, timestamp, segment_name)",
+    # 得点分布（GROUP BY score）をインデックスだけで返すための複合インデックス
+    "CREATE INDEX IF NOT EXISTS idx_device_time_score"
+    " ON dart_throws(device_address, timestamp, score)",
+)
+
+_THROW_INDEX_NAMES = (
+    'idx_timestamp',
+    'idx_device',
+    'idx_device_time_segment',
+    'idx_device_time_score',
+)
+
+@lru_cache(maxsize=64)
+def _compile_filtered_sql(
+    prefix: str,
+    has_device: bool,
+    has_start: bool,
+    has_end: bool,
+    has_after: bool = False,
+    suffix: str = ""
+) -> str:
+    """フィルタ条件の組み合わせごとにSQL文字列を1回だけ組み立てる
+
+    組み合わせは高々数十通りなのでキャッシュに収まり、呼び出しごとの
+    文字列連結が消える。同じSQL文字列が使い回されるため、sqlite3
+    内部のプリペアドステートメントキャッシュにも常にヒットする。
+    """
+    parts = [prefix, "WHERE 1=1"]
+    if has_device:
+        parts.append("AND device_address = ?")
+    if has_start:
+        parts.append("AND timestamp >= ?")
+    if has_end:
+        parts.append("AND timestamp <= ?")
+    if has_after:
+        parts.append("AND id < ?")
+    if suffix:
+        parts.append(suffix)
+    return " ".join(parts)
+
+
+# INSERT文はモジュール定数にしてsqlite3内部の文キャッシュに常にヒットさせる
+_INSERT_THROW_PREFIX = (
+    "INSERT INTO dart_throws ("
+    "timestamp, segment_code, segment_name, "
+    "base_number, multiplier, score, "
+    "device_address, device_name) VALUES "
+)
+_THROW_PLACEHOLDER = "(?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_THROW_SQL = _INSERT_THROW_PREFIX + _THROW_PLACEHOLDER
+
+# SELECT句のカラム並びをDartThrowのフィールド宣言順に固定し、
+# 行タプルから位置引数でそのまま生成できるようにする
+_SELECT_THROW_PREFIX = (
+    "SELECT id, timestamp, segment_code, segment_name, "
+    "base_number, multiplier, score, device_address, device_name "
+    "FROM dart_throws"
+)
+
+# 複数行INSERTの1文あたり行数。8カラム×100行=800変数で、古いSQLiteの
+# 変数上限(999)にも収まる
+_INSERT_CHUNK_ROWS = 100
+
+
+@lru_cache(maxsize=8)
+def _multi_insert_sql(row_count: int) -> str:
+    """指定行数分の複数行INSERT文を組み立てる（行数ごとに1回だけ）"""
+    return _INSERT_THROW_PREFIX + ",".join([_THROW_PLACEHOLDER] * row_count)
+
+
+def _to_epoch_us(dt: datetime) -> int:
+    """datetimeをunixエポックマイクロ秒の整数に変換
+
+    timestampカラムはINTEGER (エポックµs)で保持する。ISO文字列比で
+    インデックスエントリが約30バイト→8バイトに縮み、範囲比較も
+    文字列比較ではなく整数比較になる。
+    """
+    return int(dt.timestamp() * 1_000_000)
+
+
+def _from_epoch_us(epoch_us: int) -> datetime:
+    """unixエポックマイクロ秒の整数をdatetimeに変換"""
+    return datetime.fromtimestamp(epoch_us / 1e6)
+
+
+def _throw_row(throw: DartThrow) -> tuple:
+    """DartThrowをINSERT用のパラメータタプルに変換"""
+    return (
+        _to_epoch_us(throw.timestamp),
+        throw.segment_code,
+        throw.segment_name,
+        throw.base_number,
+        throw.multiplier,
+        throw.score,
+        throw.device_address,
+        throw.device_name
+    )
+
 
 class DartDatabase:
     """ダーツデータを管理するデータベースクラス"""
 
-    def __init__(self, db_path: str = "data/dartslive.db"):
+    # mkdir済みディレクトリ（インスタンス生成ごとのsyscallを省く）
+    _known_dirs: set = set()
+
+    def __init__(self, db_path: str = "data/dartslive.db", fast_pragmas: bool = False):
         """
         Args:
             db_path: データベースファイルのパス
+            fast_pragmas: 耐久性より速度を優先するPRAGMAを適用する
+                （テスト・使い捨てDB用。クラッシュ時のデータ保証はなくなる）
         """
+        self._fast_pragmas = fast_pragmas
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        parent = self.db_path.parent
+        if parent not in self._known_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(parent)
+
+        # スレッドごとに接続を使い回す（毎回のconnect + SQL再パースを省く）
+        self._local = threading.local()
+
         self._initialize_database()
 
-    @contextmanager
-    def _get_connection(self):
-        """データベース接続のコンテキストマネージャー"""
+    def _create_connection(self) -> sqlite3.Connection:
+        """新しい接続を作成してPRAGMAを設定"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+
+        # WAL: 読み取り（統計API）と書き込み（BLEワーカー）を並行可能にする
+        # synchronous=NORMAL: WALと組み合わせてコミットごとのfsyncを削減
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # ページキャッシュ約20MB・mmap読み取りで集計クエリのI/Oを削減
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        # 書き込み競合時は即エラーにせず最大5秒待つ
+        conn.execute("PRAGMA busy_timeout=5000")
+
+        if self._fast_pragmas:
+            # コミットごとのfsyncを完全に省く（使い捨てDB前提）
+            conn.execute("PRAGMA synchronous=OFF")
+
+        return conn
+
+    @contextmanager
+    def _get_connection(self):
+        """データベース接続のコンテキストマネージャー（スレッドローカルに再利用）"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._create_connection()
+            self._local.conn = conn
+
         try:
             yield conn
             conn.commit()
@@ -36,19 +182,42 @@ class DartDatabase:
             conn.rollback()
             logger.error(f"データベースエラー: {e}")
             raise
-        finally:
+
+    def close(self) -> None:
+        """呼び出し元スレッドの接続を閉じる
+
+        接続はスレッドローカルなので、閉じられるのは自スレッドの分だけ。
+        プロセス終了時には未クローズでもSQLite (WAL)側で整合性は保たれる。
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
             conn.close()
+            self._local.conn = None
+            self._local.write_cursor = None
+
+    def _write_cursor(self, conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """書き込み用カーソルをスレッドローカルに使い回す
+
+        呼び出しごとのカーソル生成を省き、row_factory=Noneの設定も
+        1回で済ませる（書き込みパスではRowオブジェクトを生成しない）。
+        """
+        cursor = getattr(self._local, 'write_cursor', None)
+        if cursor is None:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            self._local.write_cursor = cursor
+        return cursor
 
     def _initialize_database(self) -> None:
         """データベースとテーブルを初期化"""
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # dart_throwsテーブル
+            # dart_throwsテーブル (timestampはエポックµsのINTEGER)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS dart_throws (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     segment_code INTEGER NOT NULL,
                     segment_name TEXT NOT NULL,
                     base_number INTEGER,
@@ -59,16 +228,12 @@ class DartDatabase:
                 )
             """)
 
-            # インデックス作成
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_timestamp
-                ON dart_throws(timestamp)
-            """)
+            # 旧スキーマ (timestampがISO文字列のTEXT) からの移行
+            self._migrate_timestamp_column(cursor)
 
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_device
-                ON dart_throws(device_address)
-            """)
+            # インデックス作成
+            for index_sql in _THROW_INDEXES:
+                cursor.execute(index_sql)
 
             # game_sessionsテーブル (将来の機能拡張用)
             cursor.execute("""
@@ -84,6 +249,51 @@ class DartDatabase:
 
             logger.info(f"データベースを初期化しました: {self.db_path}")
 
+    @staticmethod
+    def _migrate_timestamp_column(cursor: sqlite3.Cursor) -> None:
+        """timestampカラムがTEXTの旧DBをINTEGER (エポックµs)に移行"""
+        row = next(
+            (r for r in cursor.execute("PRAGMA table_info(dart_throws)")
+             if r['name'] == 'timestamp'),
+            None
+        )
+        if row is None or row['type'] != 'TEXT':
+            return
+
+        logger.info("timestampカラムをISO文字列からエポックµs整数に移行します")
+        # DDLは文ごとに自動コミットされるため、明示的なトランザクションで
+        # RENAME〜DROPまでを不可分にする。途中でクラッシュしても
+        # ロールバックで旧テーブルが残り、次回起動時に再移行される
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("ALTER TABLE dart_throws RENAME TO dart_throws_old")
+        cursor.execute("""
+            CREATE TABLE dart_throws (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp INTEGER NOT NULL,
+                segment_code INTEGER NOT NULL,
+                segment_name TEXT NOT NULL,
+                base_number INTEGER,
+                multiplier INTEGER,
+                score INTEGER,
+                device_address TEXT NOT NULL,
+                device_name TEXT
+            )
+        """)
+        # ISO文字列はローカル時刻なので'utc'修飾子でエポックに変換する。
+        # ミリ秒部はstrftime('%f')のSS.SSSから復元する（µs以下は切り捨て）
+        cursor.execute("""
+            INSERT INTO dart_throws
+            SELECT id,
+                   CAST(strftime('%s', timestamp, 'utc') AS INTEGER) * 1000000
+                       + CAST(substr(strftime('%f', timestamp), 4) AS INTEGER) * 1000,
+                   segment_code, segment_name, base_number,
+                   multiplier, score, device_address, device_name
+            FROM dart_throws_old
+        """)
+        # 旧インデックスはテーブルごと破棄され、この後再作成される
+        cursor.execute("DROP TABLE dart_throws_old")
+        cursor.execute("COMMIT")
+
     def save_throw(self, throw: DartThrow) -> int:
         """
         投擲データを保存
@@ -95,52 +305,195 @@ class DartDatabase:
             保存されたレコードのID
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO dart_throws (
-                    timestamp, segment_code, segment_name,
-                    base_number, multiplier, score,
-                    device_address, device_name
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                throw.timestamp.isoformat(),
-                throw.segment_code,
-                throw.segment_name,
-                throw.base_number,
-                throw.multiplier,
-                throw.score,
-                throw.device_address,
-                throw.device_name
-            ))
+            cursor = self._write_cursor(conn)
+            cursor.execute(_INSERT_THROW_SQL, _throw_row(throw))
 
+            # 単発INSERT直後のlastrowidは必ず設定される（mypyの絞り込み用）
             throw_id = cursor.lastrowid
-            logger.debug(f"投擲データを保存: ID={throw_id}, {throw.segment_name}")
+            assert throw_id is not None
+            logger.debug("投擲データを保存: ID=%s, %s", throw_id, throw.segment_name)
             return throw_id
 
+    def save_throws(self, throws: List[DartThrow]) -> List[int]:
+        """
+        複数の投擲データを1トランザクションでまとめて保存
+
+        ワーカースレッドからのバッチ書き込み用。スローごとにコミットする
+        save_throwと比べてディスクI/Oをバッチ件数分に集約できる。
+
+        Args:
+            throws: 投擲データのリスト
+
+        Returns:
+            保存されたレコードのIDのリスト（入力と同順）
+        """
+        if not throws:
+            return []
+
+        # 1件だけなら単発保存と同じ経路
+        if len(throws) == 1:
+            return [self.save_throw(throws[0])]
+
+        with self._get_connection() as conn:
+            cursor = self._write_cursor(conn)
+
+            # 複数行VALUESで1文あたりのステップ回数を行数分に償却する
+            for offset in range(0, len(throws), _INSERT_CHUNK_ROWS):
+                chunk = throws[offset:offset + _INSERT_CHUNK_ROWS]
+                cursor.execute(
+                    _multi_insert_sql(len(chunk)),
+                    list(itertools.chain.from_iterable(map(_throw_row, chunk)))
+                )
+
+            # 同一トランザクション内の連続INSERTなのでIDは連番になる
+            last_id = cursor.lastrowid
+            assert last_id is not None
+            count = len(throws)
+            throw_ids = list(range(last_id - count + 1, last_id + 1))
+
+            logger.debug("%d件の投擲データをバッチ保存しました", count)
+            return throw_ids
+
+    def bulk_import(self, throws: List[DartThrow]) -> int:
+        """
+        大量の投擲データを一括インポート（バックフィル・過去ログ取り込み用)
+
+        インデックスをいったん落としてからexecutemanyで挿入し、最後に
+        まとめて再構築する。行ごとのB-tree更新が一括構築1回になるため、
+        大量件数ではsave_throwsより速い。全工程を1トランザクションで
+        行うので、途中で失敗してもインデックスは失われない。
+
+        Args:
+            throws: 投擲データのリスト
+
+        Returns:
+            インポートした件数
+        """
+        if not throws:
+            return 0
+
+        with self._get_connection() as conn:
+            cursor = self._write_cursor(conn)
+            # 書き込みロックを先に取り、drop/insert/再構築を不可分にする
+            cursor.execute("BEGIN IMMEDIATE")
+
+            for index_name in _THROW_INDEX_NAMES:
+                cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+            cursor.executemany(_INSERT_THROW_SQL, map(_throw_row, throws))
+
+            for index_sql in _THROW_INDEXES:
+                cursor.execute(index_sql)
+
+            logger.info("%d件の投擲データを一括インポートしました", len(throws))
+            return len(throws)
+
     def get_throws(
         self,
         limit: Optional[int] = None,
         device_address: Optional[str] = None,
         start_time: Optional[datetime] = None,
-        end_time: Optional[datetime] = None
+        end_time: Optional[datetime] = None,
+        after_id: Optional[int] = None
     ) -> List[DartThrow]:
         """
         投擲データを取得
 
+        並びはtimestamp降順（同時刻はid降順）。bulk_importによる
+        バックフィルでは古い時刻の行が新しいidで入るため、id順は
+        時刻順の代わりにならない。ページングはOFFSETではなく
+        after_id（キーセット方式）で行い、OFFSETのような読み飛ばしを
+        発生させない。
+
         Args:
             limit: 取得件数の上限
             device_address: デバイスアドレスでフィルタ
             start_time: 開始時刻でフィルタ
             end_time: 終了時刻でフィルタ
+            after_id: このIDより古いレコードだけを返す（次ページ取得用）
 
         Returns:
-            投擲データのリスト
+            投擲データのリスト（新しい順）
         """
         with self._get_connection() as conn:
+            # カラム順が固定なのでRowオブジェクトを介さず素のタプルで受ける
             cursor = conn.cursor()
+            cursor.row_factory = None
+
+            params: List[Any] = []
+            if device_address:
+                params.append(device_address)
+            if start_time:
+                params.append(_to_epoch_us(start_time))
+            if end_time:
+                params.append(_to_epoch_us(end_time))
+            if after_id is not None:
+                params.append(after_id)
 
-            query = "SELECT * FROM dart_throws WHERE 1=1"
-            params = []
+            # timestampはINTEGERでidx_timestampがあるため、時刻降順でも
+            # インデックス走査だけで並びが得られる（idは同時刻のタイブレーク）
+            suffix = "ORDER BY timestamp DESC, id DESC"
+            if limit:
+                suffix += " LIMIT ?"
+                params.append(limit)
+
+            query = _compile_filtered_sql(
+                _SELECT_THROW_PREFIX,
+                bool(device_address), bool(start_time), bool(end_time),
+                after_id is not None, suffix
+            )
+
+            cursor.execute(query, params)
+
+            # SELECT句の並びがフィールド宣言順なので位置引数で直接生成する
+            return [
+                DartThrow(row[0], _from_epoch_us(row[1]), *row[2:])
+                for row in cursor.fetchall()
+            ]
+
+    # get_throws_columnsで選択可能なカラム（SQLに連結するためホワイトリスト制）
+    _SELECTABLE_COLUMNS = frozenset({
+        'id', 'timestamp', 'segment_code', 'segment_name',
+        'base_number', 'multiplier', 'score', 'device_address', 'device_name',
+    })
+
+    def get_throws_columns(
+        self,
+        columns: Tuple[str, ...],
+        limit: Optional[int] = None,
+        device_address: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Dict[str, list]:
+        """
+        投擲データを必要なカラムだけ列指向で取得
+
+        行ごとのDartThrow生成を省き、カラム名 -> 値リストの形で返す。
+        一部のカラムしか使わない分析用途向け。timestampカラムは
+        エポックµsの整数のまま返す。
+
+        Args:
+            columns: 取得するカラム名のタプル
+            limit: 取得件数の上限
+            device_address: デバイスアドレスでフィルタ
+            start_time: 開始時刻でフィルタ
+            end_time: 終了時刻でフィルタ
+
+        Returns:
+            {カラム名: 値のリスト} の辞書（新しい順）
+
+        Raises:
+            ValueError: 不正なカラム名が指定された場合
+        """
+        invalid = set(columns) - self._SELECTABLE_COLUMNS
+        if invalid:
+            raise ValueError(f"不正なカラム名: {sorted(invalid)}")
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            query = f"SELECT {', '.join(columns)} FROM dart_throws WHERE 1=1"
+            params: List[Any] = []
 
             if device_address:
                 query += " AND device_address = ?"
@@ -148,11 +501,11 @@ class DartDatabase:
 
             if start_time:
                 query += " AND timestamp >= ?"
-                params.append(start_time.isoformat())
+                params.append(_to_epoch_us(start_time))
 
             if end_time:
                 query += " AND timestamp <= ?"
-                params.append(end_time.isoformat())
+                params.append(_to_epoch_us(end_time))
 
             query += " ORDER BY timestamp DESC"
 
@@ -163,22 +516,11 @@ class DartDatabase:
             cursor.execute(query, params)
             rows = cursor.fetchall()
 
-            throws = []
-            for row in rows:
-                throw = DartThrow(
-                    id=row['id'],
-                    timestamp=datetime.fromisoformat(row['timestamp']),
-                    segment_code=row['segment_code'],
-                    segment_name=row['segment_name'],
-                    base_number=row['base_number'],
-                    multiplier=row['multiplier'],
-                    score=row['score'],
-                    device_address=row['device_address'],
-                    device_name=row['device_name']
-                )
-                throws.append(throw)
+            if not rows:
+                return {column: [] for column in columns}
 
-            return throws
+            # 行タプルの転置で列ごとのリストに変換（Pythonループは列数分だけ）
+            return dict(zip(columns, map(list, zip(*rows))))
 
     def get_throw_count(
         self,
@@ -200,8 +542,47 @@ class DartDatabase:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            query = "SELECT COUNT(*) as count FROM dart_throws WHERE 1=1"
-            params = []
+            params: List[Any] = []
+            if device_address:
+                params.append(device_address)
+            if start_time:
+                params.append(_to_epoch_us(start_time))
+            if end_time:
+                params.append(_to_epoch_us(end_time))
+
+            query = _compile_filtered_sql(
+                "SELECT COUNT(*) as count FROM dart_throws",
+                bool(device_address), bool(start_time), bool(end_time)
+            )
+
+            cursor.execute(query, params)
+            result = cursor.fetchone()
+            return result['count'] if result else 0
+
+    def get_segment_distribution(
+        self,
+        device_address: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        top_n: int = 10
+    ) -> List[tuple]:
+        """
+        セグメント別の投擲回数をSQLで集計
+
+        Args:
+            device_address: デバイスアドレスでフィルタ
+            start_time: 開始時刻でフィルタ
+            end_time: 終了時刻でフィルタ
+            top_n: 上位何件を取得するか
+
+        Returns:
+            (セグメント名, 投擲回数) のリスト（回数の降順）
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            query = "SELECT segment_name, COUNT(*) as count FROM dart_throws WHERE 1=1"
+            params: List[Any] = []
 
             if device_address:
                 query += " AND device_address = ?"
@@ -209,15 +590,172 @@ class DartDatabase:
 
             if start_time:
                 query += " AND timestamp >= ?"
-                params.append(start_time.isoformat())
+                params.append(_to_epoch_us(start_time))
 
             if end_time:
                 query += " AND timestamp <= ?"
-                params.append(end_time.isoformat())
+                params.append(_to_epoch_us(end_time))
+
+            query += " GROUP BY segment_name ORDER BY count DESC LIMIT ?"
+            params.append(top_n)
 
             cursor.execute(query, params)
-            result = cursor.fetchone()
-            return result['count'] if result else 0
+            return [(row['segment_name'], row['count']) for row in cursor.fetchall()]
+
+    def get_score_distribution(
+        self,
+        device_address: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> dict:
+        """
+        得点別の投擲回数をSQLで集計
+
+        Args:
+            device_address: デバイスアドレスでフィルタ
+            start_time: 開始時刻でフィルタ
+            end_time: 終了時刻でフィルタ
+
+        Returns:
+            {得点: 回数} の辞書（得点の昇順）
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            query = """
+                SELECT score, COUNT(*) as count FROM dart_throws
+                WHERE score IS NOT NULL
+            """
+            params: List[Any] = []
+
+            if device_address:
+                query += " AND device_address = ?"
+                params.append(device_address)
+
+            if start_time:
+                query += " AND timestamp >= ?"
+                params.append(_to_epoch_us(start_time))
+
+            if end_time:
+                query += " AND timestamp <= ?"
+                params.append(_to_epoch_us(end_time))
+
+            query += " GROUP BY score ORDER BY score"
+
+            cursor.execute(query, params)
+            return {row['score']: row['count'] for row in cursor.fetchall()}
+
+    def get_statistics_summary(
+        self,
+        device_address: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> dict:
+        """
+        基本統計をSQLで一括集計
+
+        行オブジェクトを生成せず、走査と集計をSQLite側で完結させる。
+
+        Args:
+            device_address: デバイスアドレスでフィルタ
+            start_time: 開始時刻でフィルタ
+            end_time: 終了時刻でフィルタ
+
+        Returns:
+            total_throws / total_score / average_score / max_score / min_score の辞書
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            query = """
+                SELECT
+                    COUNT(*) AS total_throws,
+                    COALESCE(SUM(score), 0) AS total_score,
+                    AVG(score) AS average_score,
+                    COALESCE(MAX(score), 0) AS max_score,
+                    COALESCE(MIN(score), 0) AS min_score
+                FROM dart_throws WHERE 1=1
+            """
+            params: List[Any] = []
+
+            if device_address:
+                query += " AND device_address = ?"
+                params.append(device_address)
+
+            if start_time:
+                query += " AND timestamp >= ?"
+                params.append(_to_epoch_us(start_time))
+
+            if end_time:
+                query += " AND timestamp <= ?"
+                params.append(_to_epoch_us(end_time))
+
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+
+            return {
+                'total_throws': row['total_throws'],
+                'total_score': row['total_score'],
+                'average_score': row['average_score'] if row['average_score'] is not None else 0.0,
+                'max_score': row['max_score'],
+                'min_score': row['min_score'],
+            }
+
+    def get_accuracy_summary(
+        self,
+        target_number: int,
+        device_address: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> dict:
+        """
+        特定の数字への命中状況をSQLで一括集計
+
+        Args:
+            target_number: 対象の数字 (1-20, 25)
+            device_address: デバイスアドレスでフィルタ
+            start_time: 開始時刻でフィルタ
+            end_time: 終了時刻でフィルタ
+
+        Returns:
+            total_throws / hit_count / single_count / double_count / triple_count の辞書
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            query = """
+                SELECT
+                    COUNT(*) AS total_throws,
+                    COALESCE(SUM(CASE WHEN base_number = ? THEN 1 ELSE 0 END), 0) AS hit_count,
+                    COALESCE(SUM(CASE WHEN base_number = ? AND multiplier = 1 THEN 1 ELSE 0 END), 0) AS single_count,
+                    COALESCE(SUM(CASE WHEN base_number = ? AND multiplier = 2 THEN 1 ELSE 0 END), 0) AS double_count,
+                    COALESCE(SUM(CASE WHEN base_number = ? AND multiplier = 3 THEN 1 ELSE 0 END), 0) AS triple_count
+                FROM dart_throws WHERE 1=1
+            """
+            params: List[Any] = [target_number] * 4
+
+            if device_address:
+                query += " AND device_address = ?"
+                params.append(device_address)
+
+            if start_time:
+                query += " AND timestamp >= ?"
+                params.append(_to_epoch_us(start_time))
+
+            if end_time:
+                query += " AND timestamp <= ?"
+                params.append(_to_epoch_us(end_time))
+
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+
+            return {
+                'total_throws': row['total_throws'],
+                'hit_count': row['hit_count'],
+                'single_count': row['single_count'],
+                'double_count': row['double_count'],
+                'triple_count': row['triple_count'],
+            }
 
     def delete_old_throws(self, days: int = 30) -> int:
         """
@@ -230,7 +768,7 @@ class DartDatabase:
             削除した件数
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
+            cursor = self._write_cursor(conn)
             cutoff_date = datetime.now().replace(
                 hour=0, minute=0, second=0, microsecond=0
             ) - timedelta(days=days)
@@ -238,7 +776,7 @@ class DartDatabase:
             cursor.execute("""
                 DELETE FROM dart_throws
                 WHERE timestamp < ?
-            """, (cutoff_date.isoformat(),))
+            """, (_to_epoch_us(cutoff_date),))
 
             deleted_count = cursor.rowcount
             logger.info(f"{deleted_count}件の古いデータを削除しました")
@@ -21,6 +21,9 @@ logger = get_logger(__name__)
 class DartLiveApp:
     """DARTSLIVE HOME データ取得アプリケーション"""
 
+    # 未保存の投擲がこの件数に達したら待たずにフラッシュする
+    FLUSH_THRESHOLD = 500
+
     def __init__(self, config: Optional[AppConfig] = None):
         """
         Args:
@@ -39,6 +42,8 @@ class DartLiveApp:
         self.is_running = False
         self.device_address = ""
         self.device_name = ""
+        # 投擲はいったんメモリに溜め、メインループで1秒ごとにまとめて保存する
+        self._pending_throws: list = []
 
     def _handle_dart_throw(self, segment_code: int) -> None:
         """
@@ -64,15 +69,34 @@ class DartLiveApp:
                 device_name=self.device_name
             )
 
-            # データベースに保存
-            throw_id = self.database.save_throw(throw)
+            # バッファに追加 (保存はメインループのフラッシュでまとめて行う)
+            self._pending_throws.append(throw)
+            if len(self._pending_throws) >= self.FLUSH_THRESHOLD:
+                # イベントループ上のコールバックなのでタスクとして退避する
+                asyncio.create_task(self._flush_throws())
 
             # コンソールに表示
-            logger.info(f"🎯 投擲検出: [0x{segment_code:02x}] {segment_name} ({score}点) [ID: {throw_id}]")
+            logger.info(f"🎯 投擲検出: [0x{segment_code:02x}] {segment_name} ({score}点)")
 
         except Exception as e:
             logger.error(f"投擲データの処理中にエラーが発生: {e}")
 
+    async def _flush_throws(self) -> None:
+        """バッファ内の投擲データを1トランザクションでまとめて保存
+
+        SQLiteのコミット（ディスクI/O）はワーカースレッドに逃がし、
+        イベントループ（BLE通知の受信）をブロックしない。
+        """
+        if not self._pending_throws:
+            return
+
+        batch = self._pending_throws
+        self._pending_throws = []
+        try:
+            await asyncio.to_thread(self.database.save_throws, batch)
+        except Exception as e:
+            logger.error(f"投擲データの保存中にエラーが発生: {e}")
+
     async def run(self) -> None:
         """アプリケーションを実行"""
         logger.info("=" * 60)
@@ -126,9 +150,10 @@ class DartLiveApp:
 
             self.is_running = True
 
-            # 無限ループでデータを受信
+            # 無限ループでデータを受信 (1秒ごとにバッファをフラッシュ)
             while self.is_running:
                 await asyncio.sleep(1)
+                await self._flush_throws()
 
         except KeyboardInterrupt:
             logger.info("")
@@ -147,13 +172,19 @@ class DartLiveApp:
             await self.client.stop_notify()
             await self.client.disconnect()
 
+        # 未保存の投擲を確実に書き出す
+        await self._flush_throws()
+
         # 統計情報を表示
         logger.info("")
         logger.info("=" * 60)
         logger.info("📊 セッションサマリー")
         logger.info("=" * 60)
 
-        stats = self.analyzer.get_statistics(device_address=self.device_address)
+        # 集計クエリもイベントループをブロックしないようワーカースレッドで実行
+        stats = await asyncio.to_thread(
+            self.analyzer.get_statistics, device_address=self.device_address
+        )
         logger.info(f"総投擲数: {stats['total_throws']}回")
         logger.info(f"合計得点: {stats['total_score']}点")
         if stats['total_throws'] > 0:
@@ -163,7 +194,8 @@ class DartLiveApp:
             # 最近の投擲を表示
             logger.info("")
             logger.info("直近の投擲:")
-            recent_throws = self.analyzer.get_recent_throws_summary(
+            recent_throws = await asyncio.to_thread(
+                self.analyzer.get_recent_throws_summary,
                 limit=5,
                 device_address=self.device_address
             )
@@ -0,0 +1,17 @@
+"""テストスイート共通のフィクスチャ"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """ホットなモジュールをセッション開始時に1回だけ温める
+
+    sqlite3・dataclass生成・スキーマDDLのコストを最初のテストの
+    計測時間から追い出し、--durationsの値を安定させる
+    （xdistではワーカーごとに1回走る）。
+    """
+    from src.data.models import DartThrow, GameSession  # noqa: F401
+    from src.data.storage import DartDatabase
+
+    DartDatabase(":memory:")
@@ -0,0 +1,60 @@
+"""ゲームAPIのテスト"""
+
+import pytest
+from flask import Flask
+
+from backend.api.games import games_bp
+
+
+@pytest.fixture
+def client():
+    """games_bpだけを登録した最小構成のテストクライアント"""
+    app = Flask(__name__)
+    app.register_blueprint(games_bp)
+    return app.test_client()
+
+
+class TestGamesApi:
+    """ゲームAPIエンドポイントのテスト"""
+
+    def test_create_and_get_game(self, client):
+        """ゲームを作成し、状態がJSONで往復できる"""
+        response = client.post('/api/games', json={
+            'game_type': 'zero_one',
+            'player_names': ['Player 1', 'Player 2'],
+            'settings': {
+                'starting_score': 501,
+                'finish_type': 'double'
+            }
+        })
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['success'] is True
+
+        game_id = data['game_id']
+        # scoresはプレイヤーID（int）キーの辞書。JSONでは文字列キーに
+        # 変換されて返る（ojsonifyのOPT_NON_STR_KEYS）
+        scores = data['game_state']['scores']
+        assert len(scores) == 2
+        assert all(score == 501 for score in scores.values())
+
+        # 取得でも同じ状態が返る
+        response = client.get(f'/api/games/{game_id}')
+        assert response.status_code == 200
+        state = response.get_json()['game_state']
+        assert state['scores'] == scores
+
+        # 後始末（モジュールレベルのgame_managerにゲームを残さない）
+        response = client.delete(f'/api/games/{game_id}')
+        assert response.status_code == 200
+
+    def test_create_game_without_players(self, client):
+        """プレイヤー名なしの作成はエラーになる"""
+        response = client.post('/api/games', json={
+            'game_type': 'zero_one',
+            'player_names': []
+        })
+
+        assert response.status_code == 400
+        assert response.get_json()['success'] is False
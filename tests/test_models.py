@@ -1,125 +1,93 @@
 """データモデルのテスト"""
 
 import pytest
-from datetime import datetime
 
 from src.data.models import DartThrow, GameSession
 
 
-class TestDartThrow:
-    """DartThrowモデルのテスト"""
+@pytest.fixture(scope="module")
+def dart_throw():
+    """共有のDartThrowインスタンス（書き換えずに使うこと）"""
+    return DartThrow(
+        segment_code=0x14,
+        segment_name="ダブル20",
+        base_number=20,
+        multiplier=2,
+        score=40,
+        device_address="AA:BB:CC:DD:EE:FF",
+        device_name="DARTSLIVE HOME"
+    )
 
-    def test_create_dart_throw(self):
-        """DartThrowインスタンスを作成"""
-        throw = DartThrow(
-            segment_code=0x14,
-            segment_name="ダブル20",
-            base_number=20,
-            multiplier=2,
-            score=40,
-            device_address="AA:BB:CC:DD:EE:FF",
-            device_name="DARTSLIVE HOME"
-        )
 
-        assert throw.segment_code == 0x14
-        assert throw.segment_name == "ダブル20"
-        assert throw.base_number == 20
-        assert throw.multiplier == 2
-        assert throw.score == 40
-        assert throw.device_address == "AA:BB:CC:DD:EE:FF"
-        assert throw.device_name == "DARTSLIVE HOME"
-        assert isinstance(throw.timestamp, datetime)
+@pytest.fixture(scope="module")
+def game_session():
+    """共有のGameSessionインスタンス（書き換えずに使うこと）"""
+    return GameSession(
+        device_address="AA:BB:CC:DD:EE:FF",
+        throw_count=10,
+        total_score=350
+    )
 
-    def test_dart_throw_auto_timestamp(self):
-        """タイムスタンプが自動設定される"""
-        throw = DartThrow(
-            segment_code=0x01,
-            segment_name="シングル1",
-            score=1,
-            device_address="AA:BB:CC:DD:EE:FF"
-        )
 
-        assert throw.timestamp is not None
-        assert isinstance(throw.timestamp, datetime)
+def _throw_core(throw):
+    """DartThrowの本体フィールドをタプルで取り出す（構造比較用）"""
+    return (
+        throw.segment_code, throw.segment_name, throw.base_number,
+        throw.multiplier, throw.score, throw.device_address, throw.device_name,
+    )
 
-    def test_to_dict(self):
-        """辞書形式に変換"""
-        throw = DartThrow(
-            segment_code=0x14,
-            segment_name="ダブル20",
-            base_number=20,
-            multiplier=2,
-            score=40,
-            device_address="AA:BB:CC:DD:EE:FF",
-            device_name="DARTSLIVE HOME"
+
+class TestDartThrow:
+    """DartThrowモデルのテスト"""
+
+    def test_attributes(self, dart_throw):
+        """各フィールドが指定どおりに設定される（タプル1回で構造比較）"""
+        assert _throw_core(dart_throw) == (
+            0x14, "ダブル20", 20, 2, 40, "AA:BB:CC:DD:EE:FF", "DARTSLIVE HOME",
         )
 
-        throw_dict = throw.to_dict()
+    def test_auto_timestamp(self, dart_throw):
+        """タイムスタンプが自動設定される"""
+        assert dart_throw.timestamp is not None
+
+    def test_dict_round_trip(self, dart_throw):
+        """to_dict / from_dictで往復変換できる"""
+        throw_dict = dart_throw.to_dict()
 
-        assert isinstance(throw_dict, dict)
         assert throw_dict['segment_code'] == 0x14
         assert throw_dict['segment_name'] == "ダブル20"
         assert throw_dict['score'] == 40
         assert 'timestamp' in throw_dict
 
-    def test_from_dict(self):
-        """辞書からインスタンスを生成"""
-        data = {
-            'id': 1,
-            'timestamp': datetime.now().isoformat(),
-            'segment_code': 0x14,
-            'segment_name': "ダブル20",
-            'base_number': 20,
-            'multiplier': 2,
-            'score': 40,
-            'device_address': "AA:BB:CC:DD:EE:FF",
-            'device_name': "DARTSLIVE HOME"
-        }
-
-        throw = DartThrow.from_dict(data)
+        data = dict(throw_dict, id=1)
+        restored = DartThrow.from_dict(data)
 
-        assert throw.id == 1
-        assert isinstance(throw.timestamp, datetime)
-        assert throw.segment_code == 0x14
-        assert throw.score == 40
+        assert restored.id == 1
+        # ISO文字列を経由しても時刻が正確に復元される
+        assert restored.timestamp == dart_throw.timestamp
+        assert _throw_core(restored) == _throw_core(dart_throw)
 
 
 class TestGameSession:
     """GameSessionモデルのテスト"""
 
-    def test_create_game_session(self):
-        """GameSessionインスタンスを作成"""
-        session = GameSession(
-            device_address="AA:BB:CC:DD:EE:FF",
-            throw_count=10,
-            total_score=350
+    def test_attributes(self, game_session):
+        """各フィールドが指定どおりに設定される（タプル1回で構造比較）"""
+        core = (
+            game_session.device_address, game_session.throw_count,
+            game_session.total_score, game_session.end_time,
         )
+        assert core == ("AA:BB:CC:DD:EE:FF", 10, 350, None)
 
-        assert session.device_address == "AA:BB:CC:DD:EE:FF"
-        assert session.throw_count == 10
-        assert session.total_score == 350
-        assert isinstance(session.start_time, datetime)
-        assert session.end_time is None
-
-    def test_game_session_auto_start_time(self):
+    def test_auto_start_time(self, game_session):
         """開始時刻が自動設定される"""
-        session = GameSession(device_address="AA:BB:CC:DD:EE:FF")
-
-        assert session.start_time is not None
-        assert isinstance(session.start_time, datetime)
+        assert game_session.start_time is not None
 
-    def test_to_dict(self):
+    def test_to_dict(self, game_session):
         """辞書形式に変換"""
-        session = GameSession(
-            device_address="AA:BB:CC:DD:EE:FF",
-            throw_count=5,
-            total_score=150
-        )
-
-        session_dict = session.to_dict()
+        session_dict = game_session.to_dict()
 
-        assert isinstance(session_dict, dict)
         assert session_dict['device_address'] == "AA:BB:CC:DD:EE:FF"
-        assert session_dict['throw_count'] == 5
-        assert session_dict['total_score'] == 150
+        assert session_dict['throw_count'] == 10
+        assert session_dict['total_score'] == 350
         assert 'start_time' in session_dict
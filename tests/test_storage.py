@@ -1,32 +1,42 @@
 """データストレージのテスト"""
 
+import dataclasses
+import sqlite3
+
 import pytest
-import tempfile
 from datetime import datetime, timedelta
-from pathlib import Path
 
 from src.data.models import DartThrow
 from src.data.storage import DartDatabase
 
+# テスト用の固定時刻（datetime.now()のsyscallと非決定性を排除する）
+NOW = datetime(2024, 1, 1, 12, 0, 0)
 
-@pytest.fixture
-def temp_db():
-    """テスト用の一時データベースを作成"""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
 
-    db = DartDatabase(db_path)
-    yield db
+@pytest.fixture(scope="session")
+def _session_db():
+    """セッションで共有するインメモリデータベース
 
-    # クリーンアップ
-    Path(db_path).unlink(missing_ok=True)
+    テストごとのファイル作成・DDL実行・削除を省き、リセットは
+    temp_dbフィクスチャのDELETEで行う。
+    """
+    return DartDatabase(":memory:", fast_pragmas=True)
 
 
 @pytest.fixture
+def temp_db(_session_db):
+    """テスト用のデータベース（テストごとに中身を空にして使い回す）"""
+    with _session_db._get_connection() as conn:
+        conn.execute("DELETE FROM dart_throws")
+        conn.execute("DELETE FROM game_sessions")
+    return _session_db
+
+
+@pytest.fixture(scope="module")
 def sample_throw():
-    """サンプルの投擲データを作成"""
+    """サンプルの投擲データ（モジュール内で共有、書き換えずに使うこと）"""
     return DartThrow(
-        timestamp=datetime.now(),
+        timestamp=NOW,
         segment_code=0x14,
         segment_name="ダブル20",
         base_number=20,
@@ -44,8 +54,8 @@ class TestDartDatabase:
         """投擲データを保存"""
         throw_id = temp_db.save_throw(sample_throw)
 
+        # 戻り値の型はsave_throw -> intのアノテーション＋mypyで担保する
         assert throw_id > 0
-        assert isinstance(throw_id, int)
 
     def test_get_throws(self, temp_db, sample_throw):
         """投擲データを取得"""
@@ -61,19 +71,13 @@ class TestDartDatabase:
 
     def test_get_throws_with_limit(self, temp_db, sample_throw):
         """リミット付きで投擲データを取得"""
-        # 複数のデータを保存
-        for i in range(5):
-            throw = DartThrow(
-                timestamp=datetime.now(),
-                segment_code=i,
-                segment_name=f"テスト{i}",
-                base_number=20,
-                multiplier=1,
-                score=20,
-                device_address="AA:BB:CC:DD:EE:FF",
-                device_name="Test"
-            )
-            temp_db.save_throw(throw)
+        # 共有フィクスチャから差分だけ変えた複製を作り、まとめて保存
+        throws_to_save = [
+            dataclasses.replace(
+                sample_throw, segment_code=i, segment_name=f"テスト{i}")
+            for i in range(5)
+        ]
+        temp_db.save_throws(throws_to_save)
 
         # リミット付きで取得
         throws = temp_db.get_throws(limit=3)
@@ -84,7 +88,7 @@ class TestDartDatabase:
         """デバイスアドレスでフィルタして取得"""
         # 異なるデバイスからのデータを保存
         throw1 = DartThrow(
-            timestamp=datetime.now(),
+            timestamp=NOW,
             segment_code=0x01,
             segment_name="テスト1",
             score=20,
@@ -92,7 +96,7 @@ class TestDartDatabase:
             device_name="Device1"
         )
         throw2 = DartThrow(
-            timestamp=datetime.now(),
+            timestamp=NOW,
             segment_code=0x02,
             segment_name="テスト2",
             score=30,
@@ -111,9 +115,7 @@ class TestDartDatabase:
 
     def test_get_throws_filter_by_time(self, temp_db):
         """時刻でフィルタして取得"""
-        now = datetime.now()
-        yesterday = now - timedelta(days=1)
-        tomorrow = now + timedelta(days=1)
+        yesterday = NOW - timedelta(days=1)
 
         # 昨日のデータ
         throw_old = DartThrow(
@@ -127,7 +129,7 @@ class TestDartDatabase:
 
         # 今日のデータ
         throw_new = DartThrow(
-            timestamp=now,
+            timestamp=NOW,
             segment_code=0x02,
             segment_name="新しいデータ",
             score=30,
@@ -135,28 +137,61 @@ class TestDartDatabase:
             device_name="Test"
         )
 
-        temp_db.save_throw(throw_old)
-        temp_db.save_throw(throw_new)
+        temp_db.save_throws([throw_old, throw_new])
 
-        # 今日のデータのみ取得
-        throws = temp_db.get_throws(
-            start_time=now.replace(hour=0, minute=0, second=0, microsecond=0)
-        )
+        # 今日のデータのみ取得（固定時刻なので正規化は不要）
+        throws = temp_db.get_throws(start_time=NOW - timedelta(hours=1))
 
         assert len(throws) == 1
         assert throws[0].segment_name == "新しいデータ"
 
     def test_get_throw_count(self, temp_db, sample_throw):
         """投擲数を取得"""
-        # データを保存
-        for i in range(3):
-            temp_db.save_throw(sample_throw)
+        # データを1トランザクションでまとめて保存
+        temp_db.save_throws([sample_throw] * 3)
 
         # カウントを取得
         count = temp_db.get_throw_count()
 
         assert count == 3
 
+    def test_timestamp_migration(self, tmp_path):
+        """旧スキーマ（timestampがISO文字列のTEXT）のDBが自動移行される"""
+        db_path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE dart_throws (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                segment_code INTEGER NOT NULL,
+                segment_name TEXT NOT NULL,
+                base_number INTEGER,
+                multiplier INTEGER,
+                score INTEGER,
+                device_address TEXT NOT NULL,
+                device_name TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO dart_throws "
+            "(timestamp, segment_code, segment_name, base_number, multiplier,"
+            " score, device_address, device_name) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (NOW.isoformat(), 0x14, "ダブル20", 20, 2, 40,
+             "AA:BB:CC:DD:EE:FF", "DARTSLIVE HOME")
+        )
+        conn.commit()
+        conn.close()
+
+        db = DartDatabase(db_path)
+        throws = db.get_throws()
+        db.close()
+
+        assert len(throws) == 1
+        assert throws[0].timestamp == NOW
+        assert throws[0].segment_name == "ダブル20"
+        assert throws[0].score == 40
+
     def test_delete_old_throws(self, temp_db):
         """古いデータを削除"""
         now = datetime.now()
@@ -182,8 +217,7 @@ class TestDartDatabase:
             device_name="Test"
         )
 
-        temp_db.save_throw(throw_old)
-        temp_db.save_throw(throw_new)
+        temp_db.save_throws([throw_old, throw_new])
 
         # 30日より古いデータを削除
         deleted_count = temp_db.delete_old_throws(days=30)
@@ -1,10 +1,11 @@
-"""Webアプリケーションのエントリーポイント"""
-
-import sys
-import os
-
-# プロジェクトルートをPythonパスに追加
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+"""Webアプリケーションのエントリーポイント
+
+インストール済み環境では `darts-web` コマンド（pyproject.tomlの
+console_scripts）を使うこと。このファイルはリポジトリ直下から
+`python web_app.py` で起動するための互換エントリーポイント。
+スクリプトのあるディレクトリ（=プロジェクトルート）は自動で
+sys.pathに入るため、パス操作は不要。
+"""
 
 from backend.app import start_web_server
 